@@ -4,12 +4,13 @@ import math
 import itertools
 import concurrent.futures
 import logging
-import json
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 import threading
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configure logging
 logger = logging.getLogger("business_finder")
@@ -45,6 +46,23 @@ class LogCapture:
 # Create a global log capture instance
 log_capture = LogCapture()
 
+# Seconds Google needs before a next_page_token can be used
+NEXT_PAGE_TOKEN_DELAY = 2
+
+# Shared HTTP session so grid searches reuse pooled TCP/TLS connections to
+# the Places API instead of opening a new one per request. The pool is sized
+# for the search workers plus their concurrent place detail lookups.
+HTTP_POOL_SIZE = 32
+http_session = requests.Session()
+http_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=HTTP_POOL_SIZE,
+        pool_maxsize=HTTP_POOL_SIZE,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504)),
+    ),
+)
+
 
 def get_place_details(place_id, api_key):
     """Fetch detailed information about a specific place"""
@@ -56,7 +74,7 @@ def get_place_details(place_id, api_key):
             "key": api_key,
         }
 
-        response = requests.get(url, params=params)
+        response = http_session.get(url, params=params)
         response.raise_for_status()
 
         result = response.json().get("result", {})
@@ -104,20 +122,20 @@ def generate_grid_points(center_lat, center_lng, radius, sub_radius=5000):
     # cos(lat) * 111,111 meters
     lng_offset = sub_radius / (111111 * math.cos(math.radians(center_lat)))
     
-    # Generate grid points
+    # Grid point (i, j) lies i * sub_radius north and j * sub_radius east of the
+    # center, so it is inside the search radius when i^2 + j^2 <= (radius / sub_radius)^2.
+    # Work out the span of columns inside the circle once per row instead of
+    # measuring the distance to every candidate point.
+    max_steps_sq = (radius / sub_radius) ** 2
     for i in range(-grid_size, grid_size + 1):
-        for j in range(-grid_size, grid_size + 1):
-            lat = center_lat + (i * lat_offset)
-            lng = center_lng + (j * lng_offset)
-            
-            # Calculate distance from center to this point
-            dx = (lng - center_lng) * 111111 * math.cos(math.radians(center_lat))
-            dy = (lat - center_lat) * 111111
-            distance = math.sqrt(dx*dx + dy*dy)
-            
-            # If point is within the original search radius, add it
-            if distance <= radius:
-                points.append((lat, lng))
+        remaining = max_steps_sq - i * i
+        if remaining < 0:
+            continue
+        
+        max_j = min(math.isqrt(int(remaining)), grid_size)
+        lat = center_lat + (i * lat_offset)
+        for j in range(-max_j, max_j + 1):
+            points.append((lat, center_lng + (j * lng_offset)))
     
     # If we didn't generate any points, return at least the center
     if not points:
@@ -179,9 +197,10 @@ def search_places_single(api_key, search_term, latitude, longitude, radius, min_
                 params["pagetoken"] = page_token
 
             # Make the request
-            response = requests.get(url, params=params)
+            response = http_session.get(url, params=params)
             response.raise_for_status()
             data = response.json()
+            page_received_at = time.monotonic()
 
             # Process results
             results = data.get("results", [])
@@ -238,8 +257,12 @@ def search_places_single(api_key, search_term, latitude, longitude, radius, min_
             if not page_token:
                 break
 
-            # If we have a page token, wait before making the next request
-            time.sleep(2)
+            # A page token only becomes valid a short time after it is issued.
+            # The detail lookups above usually cover that delay, so only wait
+            # for whatever is left of it.
+            remaining_delay = NEXT_PAGE_TOKEN_DELAY - (time.monotonic() - page_received_at)
+            if remaining_delay > 0:
+                time.sleep(remaining_delay)
 
         except requests.exceptions.RequestException as e:
             print(f"Error fetching places: {e}")
@@ -332,9 +355,13 @@ def determine_optimal_sub_radius(api_key, search_term, latitude, longitude, init
     
     return current_sub_radius
 
-def search_places(api_key, search_term, latitude, longitude, radius, sub_radius=3000, max_workers=5, adapt_sub_radius=True, min_price=None, max_price=None, open_now=None, place_type=None):
+def iter_search_places(
+    api_key, search_term, latitude, longitude, radius, sub_radius=3000, max_workers=5, adapt_sub_radius=True,
+    min_price=None, max_price=None, open_now=None, place_type=None
+):
     """
-    Search for places matching criteria using a grid-based approach for large radii
+    Search for places like search_places, yielding businesses in batches as each
+    grid point completes instead of waiting for the whole search
     
     Args:
         api_key: Google Places API key
@@ -346,8 +373,8 @@ def search_places(api_key, search_term, latitude, longitude, radius, sub_radius=
         max_workers: Maximum number of concurrent searches (default: 5)
         adapt_sub_radius: Whether to dynamically adjust sub-radius based on location density (default: True)
         
-    Returns:
-        List of businesses found in the search area, deduplicated
+    Yields:
+        Lists of businesses not already returned in an earlier batch
     """
     # Clear previous logs
     log_capture.clear_logs()
@@ -388,7 +415,8 @@ def search_places(api_key, search_term, latitude, longitude, radius, sub_radius=
             {"duration": duration, "count": len(results)}
         )
         
-        return results
+        yield results
+        return
     
     # If adaptive sub-radius is enabled, run a smoke test to determine optimal sub-radius
     effective_sub_radius = sub_radius
@@ -433,8 +461,8 @@ def search_places(api_key, search_term, latitude, longitude, radius, sub_radius=
     # Limit the sub-radius to the maximum allowed by the API (50000m)
     effective_sub_radius = min(effective_sub_radius, 50000)
     
-    all_businesses = []
-    seen_place_ids = set()
+    # Unique businesses keyed by place_id, kept in the order they were found
+    businesses_by_id = {}
     
     # Log parallel worker information
     log_capture.add_log(
@@ -468,10 +496,10 @@ def search_places(api_key, search_term, latitude, longitude, radius, sub_radius=
             point = future_to_point[future]
             completed_points += 1
             progress_pct = (completed_points / point_count) * 100
+            new_results = []
             
             try:
                 sub_results = future.result()
-                unique_count_before = len(seen_place_ids)
                 
                 # Check if we're hitting the API limit for this sub-search
                 if len(sub_results) >= 60:  # Near API limit
@@ -482,16 +510,14 @@ def search_places(api_key, search_term, latitude, longitude, radius, sub_radius=
                     )
                 
                 # Deduplicate based on place_id
-                new_results = []
                 for business in sub_results:
                     place_id = business.get("place_id")
-                    if place_id and place_id not in seen_place_ids:
-                        seen_place_ids.add(place_id)
-                        all_businesses.append(business)
+                    if place_id and place_id not in businesses_by_id:
+                        businesses_by_id[place_id] = business
                         new_results.append(business)
                 
                 # Calculate how many unique businesses were found
-                new_unique = len(seen_place_ids) - unique_count_before
+                new_unique = len(new_results)
                 duplicates = len(sub_results) - new_unique
                 
                 log_msg = (f"Point {point}: Found {len(sub_results)} results "
@@ -520,21 +546,53 @@ def search_places(api_key, search_term, latitude, longitude, radius, sub_radius=
                     error_msg,
                     {"point": {"lat": point[0], "lng": point[1]}, "error": str(e)}
                 )
+            
+            if new_results:
+                yield new_results
     
     # Log search completion
     duration = time.time() - start_time
-    final_msg = f"Total unique businesses found: {len(all_businesses)} in {duration:.2f} seconds"
+    final_msg = f"Total unique businesses found: {len(businesses_by_id)} in {duration:.2f} seconds"
     print(final_msg)
     
     log_capture.add_log(
         "INFO", 
         final_msg,
         {
-            "total_businesses": len(all_businesses),
+            "total_businesses": len(businesses_by_id),
             "duration": duration,
             "search_params": search_params,
             "adapted_sub_radius": effective_sub_radius
         }
     )
+
+
+def search_places(
+    api_key, search_term, latitude, longitude, radius, sub_radius=3000, max_workers=5, adapt_sub_radius=True,
+    min_price=None, max_price=None, open_now=None, place_type=None
+):
+    """
+    Search for places matching criteria using a grid-based approach for large radii
     
-    return all_businesses
+    Args:
+        api_key: Google Places API key
+        search_term: Keyword to search for
+        latitude: Central latitude for the search
+        longitude: Central longitude for the search
+        radius: Search radius in meters
+        sub_radius: Sub-radius to use for each grid point search (default: 3000m)
+        max_workers: Maximum number of concurrent searches (default: 5)
+        adapt_sub_radius: Whether to dynamically adjust sub-radius based on location density (default: True)
+        
+    Returns:
+        List of businesses found in the search area, deduplicated
+    """
+    return [
+        business
+        for batch in iter_search_places(
+            api_key, search_term, latitude, longitude, radius,
+            sub_radius=sub_radius, max_workers=max_workers, adapt_sub_radius=adapt_sub_radius,
+            min_price=min_price, max_price=max_price, open_now=open_now, place_type=place_type
+        )
+        for business in batch
+    ]
@@ -1,4 +1,5 @@
 # File: business_finder/config.py
+import copy
 import json
 import os
 import yaml
@@ -105,8 +106,8 @@ def _apply_env_vars(config):
 
 def get_config():
     """Get configuration from environment, YAML config files and legacy JSON config"""
-    # Start with default config
-    config = DEFAULT_CONFIG.copy()
+    # Start with default config (deep copy so merges never mutate the defaults)
+    config = copy.deepcopy(DEFAULT_CONFIG)
     
     # Try to load from config files in order of precedence
     for config_path in CONFIG_PATHS:
@@ -20,11 +20,15 @@ def write_to_csv(businesses, output_file):
                 "is_open_now",
                 "place_id",
             ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.writer(csvfile)
 
-            writer.writeheader()
-            for business in businesses:
-                writer.writerow(business)
+            writer.writerow(fieldnames)
+            # Pull the exported columns straight out of each record; any extra
+            # keys (types, status, price level) are left out of the CSV
+            writer.writerows(
+                [business.get(field, "") for field in fieldnames]
+                for business in businesses
+            )
 
         print(f"Successfully exported {len(businesses)} businesses to {output_file}")
         return True
@@ -1,5 +1,5 @@
 # File: business_finder/exporters/json_exporter.py
-import json
+import orjson
 
 
 def write_to_json(businesses, output_file):
@@ -9,8 +9,9 @@ def write_to_json(businesses, output_file):
         return False
 
     try:
-        with open(output_file, "w", encoding="utf-8") as jsonfile:
-            json.dump(businesses, jsonfile, indent=2)
+        # Serialize in one call and write the UTF-8 bytes in a single write
+        with open(output_file, "wb") as jsonfile:
+            jsonfile.write(orjson.dumps(businesses, option=orjson.OPT_INDENT_2))
 
         print(f"Successfully exported {len(businesses)} businesses to {output_file}")
         return True
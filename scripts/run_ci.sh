@@ -21,9 +21,9 @@ echo "==> isort..."
 poetry run isort --check-only --profile black business_finder tests
 
 echo "===> Running tests..."
-poetry run pytest
+poetry run pytest -n auto
 
 echo "===> Running test coverage..."
-poetry run pytest --cov=business_finder --cov-branch --cov-report=term
+poetry run pytest -n auto --cov=business_finder --cov-branch --cov-report=term
 
 echo "===> All CI checks passed! 🎉"
\ No newline at end of file
@@ -7,6 +7,7 @@ setup(
     packages=find_packages(),
     install_requires=[
         "requests>=2.25.0",
+        "orjson>=3.8.0",
     ],
     entry_points={
         "console_scripts": [
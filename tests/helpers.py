@@ -0,0 +1,12 @@
+"""
+Shared assertion helpers for the test suite.
+"""
+
+
+def assert_params(mock_get, call_index=-1, **expected):
+    """Assert that a mocked HTTP GET call was made with the expected query params."""
+    params = mock_get.call_args_list[call_index].kwargs["params"]
+    for key, value in expected.items():
+        assert (
+            params[key] == value
+        ), f"params[{key!r}] == {params.get(key)!r}, expected {value!r}"
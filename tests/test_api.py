@@ -9,11 +9,12 @@ from tests.fixtures.mock_responses import (
     MOCK_PLACE_DETAILS_RESPONSE,
     MOCK_PLACE_SEARCH_RESPONSE,
 )
+from tests.helpers import assert_params
 
 
 class TestPlacesAPI:
 
-    @patch("business_finder.api.places.requests.get")
+    @patch("business_finder.api.places.http_session.get")
     def test_get_place_details_success(self, mock_get):
         # Set up mock response
         mock_response = MagicMock()
@@ -28,11 +29,9 @@ class TestPlacesAPI:
 
         # Verify request parameters
         mock_get.assert_called_once()
-        args, kwargs = mock_get.call_args
-        assert kwargs["params"]["place_id"] == "place123"
-        assert kwargs["params"]["key"] == "test_api_key"
+        assert_params(mock_get, place_id="place123", key="test_api_key")
 
-    @patch("business_finder.api.places.requests.get")
+    @patch("business_finder.api.places.http_session.get")
     def test_get_place_details_request_exception(self, mock_get):
         # Set up mock to raise exception
         mock_get.side_effect = requests.exceptions.RequestException("Test error")
@@ -45,7 +44,7 @@ class TestPlacesAPI:
 
     @patch("business_finder.api.places.time.sleep")  # Mock sleep to speed up tests
     @patch("business_finder.api.places.get_place_details")
-    @patch("business_finder.api.places.requests.get")
+    @patch("business_finder.api.places.http_session.get")
     def test_search_places_success(self, mock_get, mock_get_details, mock_sleep):
         # Set up mock responses
         mock_response = MagicMock()
@@ -84,14 +83,16 @@ class TestPlacesAPI:
 
         # Verify request parameters
         mock_get.assert_called_once()
-        args, kwargs = mock_get.call_args
-        assert kwargs["params"]["location"] == "37.7749,-122.4194"
-        assert kwargs["params"]["radius"] == 1000
-        assert kwargs["params"]["keyword"] == "cafe"
-        assert kwargs["params"]["key"] == "test_api_key"
+        assert_params(
+            mock_get,
+            location="37.7749,-122.4194",
+            radius=1000,
+            keyword="cafe",
+            key="test_api_key",
+        )
 
     @patch("business_finder.api.places.time.sleep")  # Mock sleep to speed up tests
-    @patch("business_finder.api.places.requests.get")
+    @patch("business_finder.api.places.http_session.get")
     def test_search_places_request_exception(self, mock_get, mock_sleep):
         # Set up mock to raise exception
         mock_get.side_effect = requests.exceptions.RequestException("Test error")
@@ -104,7 +105,7 @@ class TestPlacesAPI:
 
     @patch("business_finder.api.places.time.sleep")  # Mock sleep to speed up tests
     @patch("business_finder.api.places.get_place_details")
-    @patch("business_finder.api.places.requests.get")
+    @patch("business_finder.api.places.http_session.get")
     def test_search_places_multiple_pages(self, mock_get, mock_get_details, mock_sleep):
         # Create responses for pagination
         first_response = {
@@ -140,5 +141,31 @@ class TestPlacesAPI:
         assert mock_get.call_count == 2
 
         # Verify second call included page token
-        args, kwargs = mock_get.call_args_list[1]
-        assert kwargs["params"]["pagetoken"] == "test_token"
+        assert_params(mock_get, call_index=1, pagetoken="test_token")
+
+    @patch("business_finder.api.places.time.monotonic")
+    @patch("business_finder.api.places.time.sleep")  # Mock sleep to speed up tests
+    @patch("business_finder.api.places.get_place_details")
+    @patch("business_finder.api.places.http_session.get")
+    def test_search_places_page_delay_overlaps_details(
+        self, mock_get, mock_get_details, mock_sleep, mock_monotonic
+    ):
+        first_response = MagicMock()
+        first_response.json.return_value = {
+            "results": [{"name": "Test Business 1", "place_id": "place123"}],
+            "next_page_token": "test_token",
+        }
+        second_response = MagicMock()
+        second_response.json.return_value = {"results": [], "status": "OK"}
+        mock_get.side_effect = [first_response, second_response]
+        mock_get_details.return_value = {"name": "Test Business"}
+
+        # Detail lookups for the first page take longer than the token delay
+        mock_monotonic.side_effect = [0.0, 5.0, 5.0]
+
+        result = search_places("test_api_key", "cafe", 37.7749, -122.4194, 1000)
+
+        assert len(result) == 1
+        assert mock_get.call_count == 2
+        # Only the per-detail rate limit sleep happens, not the page token delay
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.2]
@@ -1,5 +1,5 @@
+import io
 import json
-import os
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, mock_open, patch
@@ -11,62 +11,49 @@ from business_finder.config import get_api_key, save_api_key
 
 class TestConfig:
     @pytest.fixture(autouse=True)
-    def setup_teardown(self):
-        # Save current environment variables
-        self.original_env = os.environ.copy()
-
-        # Provide the fixture
-        yield
-
-        # Restore original environment
-        os.environ.clear()
-        os.environ.update(self.original_env)
-
-    @patch.dict(os.environ, {"GOOGLE_API_KEY": "test_api_key_env"})
-    def test_get_api_key_from_env(self):
+    def config_env(self, monkeypatch, tmp_path):
+        # Start each test without config environment variables
+        for name in (
+            "GOOGLE_API_KEY",
+            "BUSINESS_FINDER_SUB_RADIUS",
+            "BUSINESS_FINDER_MAX_WORKERS",
+        ):
+            monkeypatch.delenv(name, raising=False)
+
+        # Point the home directory at a per-test temporary directory
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+    def test_get_api_key_from_env(self, monkeypatch):
         # Test getting API key from environment variable
+        monkeypatch.setenv("GOOGLE_API_KEY", "test_api_key_env")
         api_key = get_api_key()
         assert api_key == "test_api_key_env"
 
-    @patch.dict(os.environ, {}, clear=True)  # Clear environment variables
-    @patch("business_finder.config.Path.home")
-    def test_get_api_key_from_config_file(self, mock_home):
-        # Setup mock home directory and config file
-        mock_home_dir = Path("/mock/home")
-        mock_home.return_value = mock_home_dir
+    def test_get_api_key_from_config_file(self, monkeypatch):
+        config_data = json.dumps({"api_key": "test_api_key_file"})
+        opened_paths = []
 
-        config_data = {"api_key": "test_api_key_file"}
+        # Serve every config file from a plain in-memory buffer
+        def fake_open(path, mode="r", **kwargs):
+            opened_paths.append(Path(path))
+            return io.StringIO(config_data)
 
-        # Mock the open function and file operations
-        with patch("builtins.open", mock_open(read_data=json.dumps(config_data))) as m:
-            # Mock the file exists check
-            with patch("business_finder.config.Path.exists", return_value=True):
-                api_key = get_api_key()
+        monkeypatch.setattr("builtins.open", fake_open)
 
-                assert api_key == "test_api_key_file"
-                m.assert_called_once_with(
-                    mock_home_dir / ".business_finder" / "config.json", "r"
-                )
+        # Mock the file exists check
+        with patch("business_finder.config.Path.exists", return_value=True):
+            api_key = get_api_key()
 
-    @patch.dict(os.environ, {}, clear=True)  # Clear environment variables
-    @patch("business_finder.config.Path.home")
-    def test_get_api_key_no_config(self, mock_home):
-        # Setup mock home directory
-        mock_home_dir = Path("/mock/home")
-        mock_home.return_value = mock_home_dir
+        assert api_key == "test_api_key_file"
+        assert any(path.name == "config.json" for path in opened_paths)
 
+    def test_get_api_key_no_config(self):
         # Mock the file exists check to return False
         with patch("business_finder.config.Path.exists", return_value=False):
             api_key = get_api_key()
             assert api_key is None
 
-    @patch.dict(os.environ, {}, clear=True)  # Clear environment variables
-    @patch("business_finder.config.Path.home")
-    def test_get_api_key_invalid_config(self, mock_home):
-        # Setup mock home directory
-        mock_home_dir = Path("/mock/home")
-        mock_home.return_value = mock_home_dir
-
+    def test_get_api_key_invalid_config(self):
         # Mock the file exists check
         with patch("business_finder.config.Path.exists", return_value=True):
             # Mock open to raise JSONDecodeError
@@ -74,12 +61,7 @@ class TestConfig:
                 api_key = get_api_key()
                 assert api_key is None
 
-    @patch("business_finder.config.Path.home")
-    def test_save_api_key_new_file(self, mock_home):
-        # Setup mock home directory
-        mock_home_dir = Path("/mock/home")
-        mock_home.return_value = mock_home_dir
-
+    def test_save_api_key_new_file(self):
         # Mock directory and file operations
         with patch("business_finder.config.Path.mkdir") as mock_mkdir:
             with patch("business_finder.config.Path.exists", return_value=False):
@@ -106,12 +88,7 @@ class TestConfig:
                         if isinstance(arg, str)
                     )
 
-    @patch("business_finder.config.Path.home")
-    def test_save_api_key_existing_file(self, mock_home):
-        # Setup mock home directory
-        mock_home_dir = Path("/mock/home")
-        mock_home.return_value = mock_home_dir
-
+    def test_save_api_key_existing_file(self):
         existing_config = {"api_key": "old_api_key", "other_setting": "value"}
 
         # Mock directory and file operations
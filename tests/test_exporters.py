@@ -60,6 +60,29 @@ class TestCSVExporter:
         # File should not be created
         assert not os.path.exists(self.test_file)
 
+    def test_write_to_csv_extra_and_missing_fields(self):
+        # Search results carry extra keys and may lack some exported ones
+        businesses = [
+            {
+                "name": "Test Business 1",
+                "rating": 4.5,
+                "primary_type": "cafe",
+                "secondary_types": ["food"],
+            }
+        ]
+
+        result = write_to_csv(businesses, self.test_file)
+        assert result is True
+
+        with open(self.test_file, "r", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+            assert len(rows) == 1
+            assert rows[0]["name"] == "Test Business 1"
+            assert rows[0]["rating"] == "4.5"
+            assert rows[0]["phone"] == ""
+            assert "primary_type" not in rows[0]
+
     @patch("builtins.open")
     def test_write_to_csv_io_error(self, mock_open_func):
         # Mock open to raise IOError
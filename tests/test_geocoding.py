@@ -4,6 +4,7 @@ import pytest
 import requests
 
 from business_finder.api.geocoding import geocode_address
+from tests.helpers import assert_params
 
 
 class TestGeocoding:
@@ -34,9 +35,7 @@ class TestGeocoding:
 
         # Verify request parameters
         mock_get.assert_called_once()
-        args, kwargs = mock_get.call_args
-        assert kwargs["params"]["address"] == "San Francisco"
-        assert kwargs["params"]["key"] == "test_api_key"
+        assert_params(mock_get, address="San Francisco", key="test_api_key")
 
     @patch("business_finder.api.geocoding.requests.get")
     def test_geocode_address_no_results(self, mock_get):
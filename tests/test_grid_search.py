@@ -1,11 +1,15 @@
 """
 Test the grid-based search functionality in the places module.
 """
+import math
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import patch, MagicMock
 
 from business_finder.api.places import (
     generate_grid_points,
+    iter_search_places,
     search_places,
     search_places_single,
     get_search_logs
@@ -33,17 +37,65 @@ def test_generate_grid_points():
         lat, lng = point
         # Very rough distance calculation for testing purposes
         lat_diff = abs(lat - center_lat) * 111111  # 1 degree ≈ 111,111 meters
-        lng_diff = abs(lng - center_lng) * 111111 * 0.7  # Approximate at this latitude
+        lng_diff = abs(lng - center_lng) * 111111 * math.cos(math.radians(center_lat))
         distance = (lat_diff**2 + lng_diff**2)**0.5
         assert distance <= large_radius * 1.01  # Allow for small rounding errors
-        
 
-@pytest.mark.parametrize("radius,sub_radius,expected_calls", [
-    (2000, 3000, 1),   # Small radius, no grid
-    (10000, 3000, ">1"),  # Large radius, grid search
+
+@pytest.mark.parametrize("radius,sub_radius", [
+    (10000, 2000),
+    (50000, 2000),
+    (9000, 3000),
 ])
-def test_search_places_radius_comparison(radius, sub_radius, expected_calls, monkeypatch):
-    """Test search_places with different radius scenarios."""
+def test_generate_grid_points_count(radius, sub_radius):
+    """Test that the grid holds every sub_radius step that lies inside the radius."""
+    steps = radius / sub_radius
+    grid_size = math.ceil(1.2 * steps)
+    expected = sum(
+        1
+        for i in range(-grid_size, grid_size + 1)
+        for j in range(-grid_size, grid_size + 1)
+        if i * i + j * j <= steps * steps
+    )
+
+    points = generate_grid_points(51.5074, -0.1278, radius, sub_radius)
+    assert len(points) == expected
+    assert len(set(points)) == len(points)
+
+
+@pytest.fixture(scope="module")
+def grid_search():
+    """Run one mocked grid search and share its results, calls and logs across tests."""
+    def side_effect(*args, **kwargs):
+        # Every point returns its own business plus one shared by all points
+        lat, lng = args[2], args[3]
+        return [
+            {"name": f"Business at {lat:.4f},{lng:.4f}", "place_id": f"id_{lat:.4f}_{lng:.4f}"},
+            {"name": "Duplicate", "place_id": "same_id"},
+        ]
+
+    mock_search_single = MagicMock(side_effect=side_effect)
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr('business_finder.api.places.search_places_single', mock_search_single)
+
+        # Radius larger than sub_radius to trigger grid search
+        result = search_places(
+            api_key="test_api_key",
+            search_term="test",
+            latitude=51.5074,
+            longitude=-0.1278,
+            radius=10000,
+            sub_radius=3000,
+            max_workers=2
+        )
+        logs = get_search_logs()
+
+    return SimpleNamespace(result=result, mock_search_single=mock_search_single, logs=logs)
+
+
+def test_search_places_small_radius(monkeypatch):
+    """Test search_places with a radius that fits in a single search."""
     # Setup mock
     mock_search_single = MagicMock()
     mock_search_single.return_value = [{"name": "Test Business", "place_id": "test123"}]
@@ -55,81 +107,29 @@ def test_search_places_radius_comparison(radius, sub_radius, expected_calls, mon
         search_term="test",
         latitude=51.5074,
         longitude=-0.1278,
-        radius=radius,
-        sub_radius=sub_radius,
+        radius=2000,
+        sub_radius=3000,
         max_workers=2
     )
     
-    # Verify correct number of calls
-    if expected_calls == 1:
-        assert mock_search_single.call_count == 1
-    else:
-        assert mock_search_single.call_count > 1
+    # Verify no grid search was performed
+    assert mock_search_single.call_count == 1
         
     # Verify we get results
     assert len(result) > 0
 
 
-def test_search_places_large_radius(monkeypatch):
+def test_search_places_large_radius(grid_search):
     """Test search_places with a large radius (grid search)."""
-    # Setup mock to return different results for different points
-    mock_search_single = MagicMock()
-    
-    def side_effect(*args, **kwargs):
-        lat, lng = args[2], args[3]
-        return [{"name": f"Business at {lat:.4f},{lng:.4f}", "place_id": f"id_{lat:.4f}_{lng:.4f}"}]
-        
-    mock_search_single.side_effect = side_effect
-    monkeypatch.setattr('business_finder.api.places.search_places_single', mock_search_single)
-    
-    # Call with radius larger than sub_radius
-    result = search_places(
-        api_key="test_api_key",
-        search_term="test",
-        latitude=51.5074,
-        longitude=-0.1278,
-        radius=10000,
-        sub_radius=3000,
-        max_workers=2
-    )
-    
     # Verify multiple searches were performed
-    assert mock_search_single.call_count > 1
-    assert len(result) > 1
+    assert grid_search.mock_search_single.call_count > 1
+    assert len(grid_search.result) > 1
 
 
-def test_deduplication(monkeypatch):
+def test_deduplication(grid_search):
     """Test that duplicate results are removed."""
-    # Setup mock to return some duplicate place_ids
-    mock_search_single = MagicMock()
-    calls = 0
-    
-    def side_effect(*args, **kwargs):
-        nonlocal calls
-        calls += 1
-        if calls % 2 == 0:
-            # Even calls return a duplicate ID
-            return [{"name": "Duplicate", "place_id": "same_id"}]
-        else:
-            # Odd calls return unique IDs
-            return [{"name": f"Unique {calls}", "place_id": f"id_{calls}"}]
-        
-    mock_search_single.side_effect = side_effect
-    monkeypatch.setattr('business_finder.api.places.search_places_single', mock_search_single)
-    
-    # Call with radius larger than sub_radius to trigger grid search
-    result = search_places(
-        api_key="test_api_key",
-        search_term="test",
-        latitude=51.5074,
-        longitude=-0.1278,
-        radius=10000,
-        sub_radius=3000,
-        max_workers=2
-    )
-    
     # Count unique place_ids in the result
-    place_ids = [business["place_id"] for business in result]
+    place_ids = [business["place_id"] for business in grid_search.result]
     unique_ids = set(place_ids)
     
     # Verify no duplicates in results
@@ -137,31 +137,36 @@ def test_deduplication(monkeypatch):
     assert "same_id" in unique_ids  # Verify the duplicate ID is still included once
 
 
-def test_logging(monkeypatch):
+def test_logging(grid_search):
     """Test that search operations are properly logged."""
-    # Setup mock
-    mock_search_single = MagicMock()
-    mock_search_single.return_value = [{"name": "Test", "place_id": "test123"}]
-    monkeypatch.setattr('business_finder.api.places.search_places_single', mock_search_single)
+    # Verify logs contain expected entries
+    assert len(grid_search.logs) > 0
     
-    # Perform a search
-    search_places(
+    # Check for specific log messages
+    log_messages = [log["message"] for log in grid_search.logs]
+    assert any("Starting search for" in msg for msg in log_messages)
+    assert any("Breaking search into" in msg for msg in log_messages)
+    assert any("Total unique businesses found" in msg for msg in log_messages)
+
+
+def test_iter_search_places_batches(grid_search, monkeypatch):
+    """Test that streamed batches are disjoint and add up to the full search."""
+    monkeypatch.setattr(
+        'business_finder.api.places.search_places_single',
+        grid_search.mock_search_single
+    )
+
+    batches = list(iter_search_places(
         api_key="test_api_key",
         search_term="test",
         latitude=51.5074,
         longitude=-0.1278,
         radius=10000,
-        sub_radius=3000
-    )
-    
-    # Get logs
-    logs = get_search_logs()
-    
-    # Verify logs contain expected entries
-    assert len(logs) > 0
-    
-    # Check for specific log messages
-    log_messages = [log["message"] for log in logs]
-    assert any("Starting search for" in msg for msg in log_messages)
-    assert any("Breaking search into" in msg for msg in log_messages)
-    assert any("Total unique businesses found" in msg for msg in log_messages)
\ No newline at end of file
+        sub_radius=3000,
+        max_workers=2
+    ))
+
+    streamed = [business["place_id"] for batch in batches for business in batch]
+    assert len(batches) > 1
+    assert len(streamed) == len(set(streamed))
+    assert set(streamed) == {business["place_id"] for business in grid_search.result}
@@ -2,10 +2,11 @@ import json
 import os
 import shutil
 import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 import requests
+import responses
 
 from business_finder.api.places import get_place_details, search_places
 from business_finder.exporters.csv_exporter import write_to_csv
@@ -16,6 +17,9 @@ from tests.fixtures.mock_responses import (
     MOCK_PLACE_SEARCH_RESPONSE,
 )
 
+NEARBY_SEARCH_URL = "https://maps.googleapis.com/maps/api/place/nearbysearch/json"
+PLACE_DETAILS_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+
 
 class TestIntegration:
 
@@ -33,24 +37,13 @@ class TestIntegration:
         shutil.rmtree(self.test_dir)
 
     @patch("business_finder.api.places.time.sleep")  # Mock sleep to speed up tests
-    @patch("business_finder.api.places.requests.get")
-    def test_search_and_export_workflow(self, mock_get, mock_sleep):
-        # Setup mock responses for search and details
-        search_response = MagicMock()
-        search_response.json.return_value = MOCK_PLACE_SEARCH_RESPONSE
-
-        details_response = MagicMock()
-        details_response.json.return_value = MOCK_PLACE_DETAILS_RESPONSE
-
-        # Configure mock to return different responses based on URL
-        def mock_get_side_effect(url, **kwargs):
-            if "nearbysearch" in url:
-                return search_response
-            elif "details" in url:
-                return details_response
-            return MagicMock()
-
-        mock_get.side_effect = mock_get_side_effect
+    @responses.activate
+    def test_search_and_export_workflow(self, mock_sleep):
+        # Route search and details requests to canned responses by URL
+        responses.add(responses.GET, NEARBY_SEARCH_URL, json=MOCK_PLACE_SEARCH_RESPONSE)
+        responses.add(
+            responses.GET, PLACE_DETAILS_URL, json=MOCK_PLACE_DETAILS_RESPONSE
+        )
 
         # 1. Search for businesses
         businesses = search_places("test_api_key", "cafe", 37.7749, -122.4194, 1000)
@@ -74,31 +67,31 @@ class TestIntegration:
             data = json.load(f)
             assert data[0]["name"] == "Test Business 1"
 
-    @patch("business_finder.api.places.requests.get")
-    def test_error_handling_workflow(self, mock_get):
+    @responses.activate
+    def test_error_handling_workflow(self):
         # Test error handling in the search workflow
 
         # 1. Test connection error
-        mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
+        responses.add(
+            responses.GET,
+            NEARBY_SEARCH_URL,
+            body=requests.exceptions.ConnectionError("Connection failed"),
+        )
         businesses = search_places("test_api_key", "cafe", 37.7749, -122.4194, 1000)
         assert businesses == []
 
         # 2. Test HTTP error
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
-            "404 Not Found"
-        )
-        mock_get.side_effect = None
-        mock_get.return_value = mock_response
+        responses.replace(responses.GET, NEARBY_SEARCH_URL, status=404)
 
         businesses = search_places("test_api_key", "cafe", 37.7749, -122.4194, 1000)
         assert businesses == []
 
         # 3. Test empty response
-        mock_response = MagicMock()
-        mock_response.raise_for_status.side_effect = None
-        mock_response.json.return_value = {"status": "ZERO_RESULTS", "results": []}
-        mock_get.return_value = mock_response
+        responses.replace(
+            responses.GET,
+            NEARBY_SEARCH_URL,
+            json={"status": "ZERO_RESULTS", "results": []},
+        )
 
         businesses = search_places("test_api_key", "cafe", 37.7749, -122.4194, 1000)
         assert businesses == []
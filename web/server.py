@@ -4,32 +4,397 @@ Simple backend server for the Business Finder web app
 This connects the web interface to the CLI tool
 """
 
-import json
+import logging
+import math
 import os
-import subprocess
+import re
 import sys
 import sqlite3
 import time
 import hashlib
-from datetime import datetime, timedelta
+import gzip
+import queue
+import signal
+import threading
+import traceback
+import uuid
+import zlib
+import concurrent.futures
+from collections import OrderedDict
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-import urllib.parse
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+import orjson
 
 # Add parent directory to path so we can import from business_finder
 parent_dir = str(Path(__file__).resolve().parent.parent)
 sys.path.append(parent_dir)
 
-from business_finder.api.places import search_places, get_search_logs
-from business_finder.config import get_api_key, get_config
+from business_finder.api.places import search_places, iter_search_places, get_search_logs
+from business_finder.config import get_api_key, get_config, get_max_workers
+from business_finder.exporters.sheets_exporter import export_to_sheets
 
 # Default port
 PORT = 8000
 
+# Server log records are queued and written by a listener thread so request
+# threads never block on console output
+logger = logging.getLogger('business_finder.server')
+
+def setup_logging(level=logging.INFO):
+    """Route server logging through a queue and start the thread that writes it out"""
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    
+    listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(level)
+    logger.propagate = False
+    listener.start()
+    return listener
+
+# Searches run on a shared pool so concurrent clients overlap their grid
+# searches while capping the outbound load on the Places API
+SEARCH_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=get_max_workers())
+# Maximum time a client waits for a search to finish (in seconds)
+SEARCH_TIMEOUT = 300
+
+# Searches that are still running, keyed by their parameter hash, so identical
+# concurrent requests share one grid search instead of each starting their own
+inflight_searches = {}
+inflight_searches_lock = threading.Lock()
+
+def finish_search_when_done(param_hash, params, future):
+    """
+    Once a search completes, save and cache its results and remove it from the
+    in-progress table. This happens whether or not any client is still waiting.
+    
+    A successful search stays in the table until its cache write has been
+    committed, so an identical request arriving in between joins the finished
+    future instead of missing the cache and searching again.
+    """
+    def forget_search(_):
+        with inflight_searches_lock:
+            if inflight_searches.get(param_hash) is future:
+                del inflight_searches[param_hash]
+    
+    def finish_search(_):
+        if future.cancelled() or future.exception() is not None:
+            forget_search(None)
+            return
+        try:
+            cache_write = save_search_results(params, future.result(), param_hash)
+        except Exception as e:
+            logger.error(f"Error saving search results: {e}")
+            forget_search(None)
+            return
+        cache_write.add_done_callback(forget_search)
+    
+    future.add_done_callback(finish_search)
+
+def submit_search(param_hash, params, search_fn, *args, **kwargs):
+    """
+    Submit a search to the search pool, joining an identical search already in progress
+    
+    Returns (future, owner); owner is False if the future belongs to a search
+    that was already running.
+    """
+    with inflight_searches_lock:
+        future = inflight_searches.get(param_hash)
+        if future is not None:
+            logger.debug("Joining in-progress search with hash %s", param_hash)
+            return future, False
+        
+        future = SEARCH_POOL.submit(search_fn, *args, **kwargs)
+        inflight_searches[param_hash] = future
+    
+    finish_search_when_done(param_hash, params, future)
+    return future, True
+
+def stream_search_places(batch_queue, *args, **kwargs):
+    """
+    Run iter_search_places, putting each batch on batch_queue as it arrives
+    
+    Returns every business found. None is put on the queue once the search
+    has finished or failed.
+    """
+    businesses = []
+    try:
+        for batch in iter_search_places(*args, **kwargs):
+            businesses.extend(batch)
+            batch_queue.put(batch)
+    finally:
+        batch_queue.put(None)
+    return businesses
+
 # Database setup
 DATA_DIR = os.path.join(parent_dir, 'data')
 DB_PATH = os.path.join(DATA_DIR, 'search_cache.db')
 
+# The API key is read from config once per process; send SIGHUP to reload it
+api_key_cache = {'key': None}
+
+def reload_api_key(*_):
+    """Re-read the API key from the environment/config files"""
+    api_key_cache['key'] = get_api_key()
+    return api_key_cache['key']
+
+def get_cached_api_key():
+    """Get the API key, only going back to config if it has not been found yet"""
+    return api_key_cache['key'] or reload_api_key()
+
+# Search result files are written by a background thread so the HTTP
+# response never waits on disk I/O
+RESULTS_WRITE_QUEUE_SIZE = 64
+results_write_queue = queue.Queue(maxsize=RESULTS_WRITE_QUEUE_SIZE)
+
+# Digest of the last contents written to each results file, so repeating a
+# search with unchanged results does not rewrite the whole file. Only the
+# writer thread touches it; the least recently written files are forgotten
+# once it holds RESULTS_DIGESTS_MAX entries.
+RESULTS_DIGESTS_MAX = 1024
+written_results_digests = OrderedDict()
+
+def results_writer_loop():
+    """Write queued search results to disk until the process exits"""
+    while True:
+        results_path, businesses = results_write_queue.get()
+        try:
+            content = orjson.dumps(businesses, option=orjson.OPT_INDENT_2)
+            digest = hashlib.md5(content).digest()
+            if written_results_digests.get(results_path) == digest and os.path.exists(results_path):
+                logger.debug("Results unchanged, not rewriting %s", results_path)
+                written_results_digests.move_to_end(results_path)
+                continue
+            # Write to a temporary file and rename it over the old one, so a
+            # reader never sees a half-written results file
+            temp_path = f"{results_path}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, results_path)
+            written_results_digests[results_path] = digest
+            written_results_digests.move_to_end(results_path)
+            if len(written_results_digests) > RESULTS_DIGESTS_MAX:
+                written_results_digests.popitem(last=False)
+        except Exception as e:
+            logger.error(f"Error saving search results to {results_path}: {e}")
+        finally:
+            results_write_queue.task_done()
+
+def start_results_writer():
+    """Start the daemon thread that persists search results"""
+    writer = threading.Thread(target=results_writer_loop, name='results-writer', daemon=True)
+    writer.start()
+    return writer
+
+def save_results_async(results_path, businesses):
+    """Queue search results to be written to disk, dropping them if the writer is backed up"""
+    try:
+        results_write_queue.put_nowait((results_path, businesses))
+        return True
+    except queue.Full:
+        logger.warning(f"Results writer queue is full, not saving {results_path}")
+        return False
+
+# Runs of anything other than letters and digits, replaced by a single
+# underscore when building results filenames from search terms
+UNSAFE_FILENAME_CHARS_RE = re.compile(r'[\W_]+')
+
+def save_search_results(params, businesses, param_hash=None):
+    """Queue a finished search's results to be saved and cached, returning the cache write's future"""
+    # Create a snake_case filename from the search term, defaulting to a
+    # simple name if nothing alphanumeric is left
+    search_term_safe = UNSAFE_FILENAME_CHARS_RE.sub('_', params['search_term'].lower()).strip('_') or "business"
+    
+    # Create a descriptive filename, with coordinates for more context
+    results_filename = f"{search_term_safe}_at_{params['latitude']:.2f}_{params['longitude']:.2f}.json"
+    
+    # Save a copy to the data directory (created by init_database at startup)
+    save_results_async(os.path.join(DATA_DIR, results_filename), businesses)
+    
+    return cache_search_results_async(params, businesses, param_hash)
+
+# Search results are cached by a single background thread, so responses do
+# not wait on the SQLite commit and cache writes never contend with each other
+CACHE_WRITE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='cache-writer')
+
+def cache_search_results_async(params, results, param_hash=None):
+    """Queue search results to be stored in the cache"""
+    return CACHE_WRITE_POOL.submit(cache_search_results, params, results, param_hash)
+
+def wait_for_cache_writes():
+    """Block until every cache write queued so far has finished"""
+    # The pool has one worker, so a no-op task completes after all earlier writes
+    CACHE_WRITE_POOL.submit(lambda: None).result()
+
+# Google Sheets OAuth client secret, and the token stored after consent
+CREDENTIALS_PATH = os.path.join(parent_dir, 'credentials', 'client_secret.json')
+TOKEN_PATH = os.path.join(parent_dir, 'credentials', 'token.json')
+
+# Google Sheets exports run on a single background worker: the first one may
+# wait on the user completing OAuth consent in the browser, and concurrent
+# exports would race on writing the token file. Finished jobs are kept until
+# the page polls for them.
+SHEETS_EXPORT_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix='sheets-export')
+SHEETS_EXPORT_JOBS_MAX = 32
+sheets_export_jobs = {}
+sheets_export_jobs_lock = threading.Lock()
+
+def export_search_to_sheets(businesses, spreadsheet_name, credentials_path, token_path):
+    """Export search results to Google Sheets, returning an HTTP status and response payload"""
+    # Without credentials the exporter falls back to a mock export, so say so
+    if not os.path.exists(credentials_path):
+        logger.warning("Credentials file not found at: %s", credentials_path)
+
+    # When in debug mode, log more info (the token check costs extra stat() calls)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("=== SHEETS EXPORT ===")
+        logger.debug("Businesses count: %s", len(businesses))
+        logger.debug("Spreadsheet name: %s", spreadsheet_name)
+        logger.debug("Credentials path: %s", credentials_path)
+        logger.debug("Token path: %s (exists: %s, not needed on first run)", token_path, os.path.exists(token_path))
+
+    try:
+        # Export results to Google Sheets
+        logger.info(f"Exporting to Google Sheets: {len(businesses)} businesses")
+
+        # Don't create dummy data - if no businesses found, export empty sheet
+        if not businesses:
+            logger.warning("No businesses found for the search criteria")
+            # Continue with empty list - Google Sheets export will handle this
+
+        # Try export with verbose error handling
+        logger.debug("Calling export_to_sheets function with valid parameters...")
+
+        sheet_url = export_to_sheets(
+            businesses, 
+            spreadsheet_name=spreadsheet_name,
+            credentials_path=credentials_path,
+            token_path=token_path
+        )
+
+        logger.info(f"Successfully exported to Google Sheets: {sheet_url}")
+
+        return 200, {
+            'success': True,
+            'url': sheet_url
+        }
+    except Exception as e:
+        logger.error(f"Error exporting to Google Sheets: {e}")
+        error_message = str(e)
+
+        # Check for specific API errors
+        if 'Google Drive API has not been used' in error_message:
+            error_message = "Google Drive API is not enabled. Please visit the Google Cloud Console to enable it."
+        elif 'access_denied' in error_message:
+            error_message = "OAuth consent screen access denied. Make sure your email is added as a test user in the Google Cloud Console."
+
+        # Log detailed error for debugging
+        logger.error(f"Detailed error: {traceback.format_exc()}")
+
+        # Return proper error response instead of mock data
+        return 500, {
+            'success': False,
+            'error': error_message,
+            'fix_instructions': "To fix Google Sheets export issues, please enable both Google Sheets API and Google Drive API in your Google Cloud Console and ensure proper OAuth credentials are configured."
+        }
+
+def submit_sheets_export(businesses, spreadsheet_name, credentials_path, token_path):
+    """Queue a Google Sheets export and return its job ID"""
+    job_id = uuid.uuid4().hex
+    future = SHEETS_EXPORT_POOL.submit(
+        export_search_to_sheets, businesses, spreadsheet_name, credentials_path, token_path
+    )
+    with sheets_export_jobs_lock:
+        # Forget finished exports nobody came back for
+        if len(sheets_export_jobs) >= SHEETS_EXPORT_JOBS_MAX:
+            for key in [key for key, job in sheets_export_jobs.items() if job.done()]:
+                del sheets_export_jobs[key]
+        sheets_export_jobs[job_id] = future
+    return job_id
+
+def pop_finished_sheets_export(job_id):
+    """Return the future for an export job, forgetting the job once it has finished"""
+    with sheets_export_jobs_lock:
+        future = sheets_export_jobs.get(job_id)
+        if future is not None and future.done():
+            del sheets_export_jobs[job_id]
+        return future
+
+# Open SQLite connections kept for reuse between requests, so API calls do
+# not pay for opening the database file and reading its schema every time
+DB_POOL_SIZE = 8
+# Connections opened at startup, before any request needs one
+DB_POOL_WARM_SIZE = 2
+db_pool = queue.Queue(maxsize=DB_POOL_SIZE)
+# Seconds a connection waits for another connection's write lock before failing
+DB_BUSY_TIMEOUT = 10
+# Bytes of the database file each connection may memory-map
+DB_MMAP_SIZE = 256 * 1024 * 1024
+
+def open_db_connection():
+    """Open a database connection that can be handed between request threads"""
+    conn = sqlite3.connect(DB_PATH, timeout=DB_BUSY_TIMEOUT, check_same_thread=False)
+    # Enforce foreign keys so deleting a search cascades to its results
+    conn.execute("PRAGMA foreign_keys = ON")
+    # WAL (set in init_database) stays durable with NORMAL sync and fewer fsyncs
+    conn.execute("PRAGMA synchronous = NORMAL")
+    # Read database pages through a memory map and keep temporary tables and
+    # sort buffers in memory
+    conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    return conn
+
+def acquire_db_connection():
+    """Take a connection from the pool, opening a new one if none are idle"""
+    try:
+        return db_pool.get_nowait()
+    except queue.Empty:
+        return open_db_connection()
+
+def warm_db_pool(count=DB_POOL_WARM_SIZE):
+    """Open connections ahead of the first requests so they skip the connect and pragma setup"""
+    for _ in range(count - db_pool.qsize()):
+        release_db_connection(open_db_connection())
+
+def release_db_connection(conn):
+    """Return a connection to the pool, closing it if the pool is already full"""
+    # Never hand on a connection with an unfinished transaction
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        db_pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+# How often the background maintenance thread refreshes query planner statistics
+DB_OPTIMIZE_INTERVAL = 24 * 60 * 60
+
+def optimize_database():
+    """Let SQLite refresh planner statistics for tables that have changed enough to need it"""
+    conn = acquire_db_connection()
+    try:
+        conn.execute("PRAGMA optimize")
+    except Exception as e:
+        logger.error(f"Error optimizing database: {e}")
+    finally:
+        release_db_connection(conn)
+
+def db_maintenance_loop():
+    """Optimize the database periodically until the process exits"""
+    while True:
+        time.sleep(DB_OPTIMIZE_INTERVAL)
+        optimize_database()
+
+def start_db_maintenance():
+    """Start the daemon thread that keeps planner statistics current"""
+    maintenance = threading.Thread(target=db_maintenance_loop, name='db-maintenance', daemon=True)
+    maintenance.start()
+    return maintenance
+
 # Ensure the database path is in .gitignore to prevent committing large databases
 def ensure_in_gitignore():
     """Make sure the database file is in .gitignore"""
@@ -57,9 +422,15 @@ def ensure_in_gitignore():
             f.write("data/*\n")
             f.write("!data/.gitkeep\n")
 
+# Stored in the database's user_version; bump it when adding a migration
+SCHEMA_VERSION = 1
+
 def migrate_database(conn, cursor):
     """Apply migrations to the database schema"""
-    print("Checking for needed database migrations...")
+    logger.info("Checking for needed database migrations...")
+    
+    # Apply every migration in one transaction, so they commit together
+    cursor.execute("BEGIN IMMEDIATE")
     
     # Check if sub_radius column exists
     cursor.execute("PRAGMA table_info(searches)")
@@ -67,44 +438,61 @@ def migrate_database(conn, cursor):
     
     # Add sub_radius column if it doesn't exist
     if 'sub_radius' not in columns:
-        print("Migrating: Adding sub_radius column to searches table")
+        logger.info("Migrating: Adding sub_radius column to searches table")
         cursor.execute("ALTER TABLE searches ADD COLUMN sub_radius INTEGER DEFAULT 3000")
-        conn.commit()
     
     # Add max_workers column if it doesn't exist
     if 'max_workers' not in columns:
-        print("Migrating: Adding max_workers column to searches table")
+        logger.info("Migrating: Adding max_workers column to searches table")
         cursor.execute("ALTER TABLE searches ADD COLUMN max_workers INTEGER DEFAULT 5")
-        conn.commit()
     
     # Add adapt_sub_radius column if it doesn't exist
     if 'adapt_sub_radius' not in columns:
-        print("Migrating: Adding adapt_sub_radius column to searches table")
+        logger.info("Migrating: Adding adapt_sub_radius column to searches table")
         cursor.execute("ALTER TABLE searches ADD COLUMN adapt_sub_radius BOOLEAN DEFAULT 1")
-        conn.commit()
     
     # Add filter columns if they don't exist
     if 'min_price' not in columns:
-        print("Migrating: Adding min_price column to searches table")
+        logger.info("Migrating: Adding min_price column to searches table")
         cursor.execute("ALTER TABLE searches ADD COLUMN min_price INTEGER")
-        conn.commit()
     
     if 'max_price' not in columns:
-        print("Migrating: Adding max_price column to searches table")
+        logger.info("Migrating: Adding max_price column to searches table")
         cursor.execute("ALTER TABLE searches ADD COLUMN max_price INTEGER")
-        conn.commit()
     
     if 'open_now' not in columns:
-        print("Migrating: Adding open_now column to searches table")
+        logger.info("Migrating: Adding open_now column to searches table")
         cursor.execute("ALTER TABLE searches ADD COLUMN open_now BOOLEAN")
-        conn.commit()
     
     if 'place_type' not in columns:
-        print("Migrating: Adding place_type column to searches table")
+        logger.info("Migrating: Adding place_type column to searches table")
         cursor.execute("ALTER TABLE searches ADD COLUMN place_type TEXT")
-        conn.commit()
     
-    print("Database migration checks completed")
+    # Convert ISO-format created_at strings to integer epoch seconds
+    cursor.execute("SELECT id, created_at FROM searches WHERE typeof(created_at) = 'text'")
+    text_timestamps = cursor.fetchall()
+    if text_timestamps:
+        logger.info(f"Migrating: Converting {len(text_timestamps)} search timestamps to epoch seconds")
+        cursor.executemany(
+            "UPDATE searches SET created_at = ? WHERE id = ?",
+            [(int(datetime.fromisoformat(created_at).timestamp()), search_id) for search_id, created_at in text_timestamps]
+        )
+    
+    # Compress results that were stored as plain JSON (first byte '[' or '{')
+    cursor.execute("SELECT id, json_data FROM results WHERE hex(substr(json_data, 1, 1)) IN ('5B', '7B')")
+    uncompressed = cursor.fetchall()
+    if uncompressed:
+        logger.info(f"Migrating: Compressing {len(uncompressed)} cached results")
+        cursor.executemany(
+            "UPDATE results SET json_data = ? WHERE id = ?",
+            [(encode_results(decode_results(json_data)), result_id) for result_id, json_data in uncompressed]
+        )
+    
+    # Record that the schema is current so later starts can skip these checks
+    cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    
+    conn.commit()
+    logger.info("Database migration checks completed")
 
 
 def init_database():
@@ -112,18 +500,21 @@ def init_database():
     # Create data directory if it doesn't exist
     os.makedirs(DATA_DIR, exist_ok=True)
     
-    # Create a .gitkeep file to ensure the directory is tracked but contents are ignored
-    gitkeep_path = os.path.join(DATA_DIR, '.gitkeep')
-    if not os.path.exists(gitkeep_path):
-        with open(gitkeep_path, 'w') as f:
-            f.write("# This file ensures the data directory is tracked by git\n")
-    
-    # Ensure the database is in gitignore
-    ensure_in_gitignore()
-    
     # Check if the database already exists
     db_exists = os.path.exists(DB_PATH)
     
+    # The repository setup below only needs to happen when the database is
+    # first created, not on every start
+    if not db_exists:
+        # Create a .gitkeep file to ensure the directory is tracked but contents are ignored
+        gitkeep_path = os.path.join(DATA_DIR, '.gitkeep')
+        if not os.path.exists(gitkeep_path):
+            with open(gitkeep_path, 'w') as f:
+                f.write("# This file ensures the data directory is tracked by git\n")
+        
+        # Ensure the database is in gitignore
+        ensure_in_gitignore()
+    
     # Connect to database (creates it if it doesn't exist)
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
@@ -143,7 +534,7 @@ def init_database():
         max_price INTEGER,
         open_now BOOLEAN,
         place_type TEXT,
-        created_at TIMESTAMP,
+        created_at INTEGER,
         hash TEXT UNIQUE
     )
     ''')
@@ -158,27 +549,118 @@ def init_database():
     )
     ''')
     
-    # Enable foreign keys for cascading deletes
-    cursor.execute("PRAGMA foreign_keys = ON")
+    # One results row per search, so cache writes can upsert on search_id
+    cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_results_search_id ON results (search_id)")
+    
+    # Recent searches and old-search cleanup order and filter by created_at
+    # (lookups by hash already use the index behind its UNIQUE constraint)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_searches_created_at ON searches (created_at)")
+    
+    # Write-ahead logging lets readers run alongside a writer; the mode is
+    # stored in the database file so pooled connections pick it up
+    journal_mode = cursor.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+    if journal_mode != 'wal':
+        logger.warning(f"Could not enable WAL journaling, database is using {journal_mode}")
     
     conn.commit()
     
-    # Run migrations if database already existed
+    # Run migrations if an existing database predates the current schema
     if db_exists:
-        migrate_database(conn, cursor)
+        user_version = cursor.execute("PRAGMA user_version").fetchone()[0]
+        if user_version < SCHEMA_VERSION:
+            migrate_database(conn, cursor)
+    else:
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     
     conn.close()
     
     # Print appropriate message based on whether DB existed
     if db_exists:
-        print(f"Connected to existing database at {DB_PATH}")
+        logger.info(f"Connected to existing database at {DB_PATH}")
     else:
-        print(f"Created new database at {DB_PATH}")
+        logger.info(f"Created new database at {DB_PATH}")
         
     # Log the database size
     if os.path.exists(DB_PATH):
         size_mb = os.path.getsize(DB_PATH) / (1024 * 1024)
-        print(f"Database size: {size_mb:.2f} MB")
+        logger.info(f"Database size: {size_mb:.2f} MB")
+    
+    warm_db_pool()
+
+def format_timestamp(timestamp):
+    """Format an epoch-seconds created_at value as a local ISO timestamp for API responses"""
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+# Cached results are stored as zlib-compressed JSON; rows written before
+# compression was introduced hold plain JSON and are still readable
+RESULTS_COMPRESSION_LEVEL = 6
+
+def encode_results(results):
+    """Serialize search results for storage in the results table"""
+    return zlib.compress(orjson.dumps(results), RESULTS_COMPRESSION_LEVEL)
+
+def decode_results_json(json_data):
+    """Return the JSON bytes of search results stored by encode_results, or stored as plain JSON"""
+    if isinstance(json_data, str):
+        return json_data.encode('utf-8')
+    if json_data[:1] in (b'[', b'{'):
+        return json_data
+    return zlib.decompress(json_data)
+
+def decode_results(json_data):
+    """Load search results stored by encode_results, or as plain JSON"""
+    return orjson.loads(decode_results_json(json_data))
+
+# SQL used on request paths, defined once so every pooled connection's
+# statement cache reuses the same prepared statements
+UPSERT_SEARCH_SQL = '''
+INSERT INTO searches
+(search_term, latitude, longitude, radius, sub_radius, max_workers, adapt_sub_radius, min_price, max_price, open_now, place_type, created_at, hash)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (hash) DO UPDATE SET
+    created_at = excluded.created_at, latitude = excluded.latitude, longitude = excluded.longitude
+'''
+
+UPSERT_RESULTS_SQL = '''
+INSERT INTO results (search_id, json_data)
+VALUES ((SELECT id FROM searches WHERE hash = ?), ?)
+ON CONFLICT (search_id) DO UPDATE SET json_data = excluded.json_data
+'''
+
+SELECT_SEARCH_BY_HASH_SQL = '''
+SELECT s.id, s.search_term, s.latitude, s.longitude, s.radius, s.sub_radius, s.max_workers, s.adapt_sub_radius, s.min_price, s.max_price, s.open_now, s.place_type, s.created_at, r.json_data
+FROM searches s
+JOIN results r ON s.id = r.search_id
+WHERE s.hash = ?
+'''
+
+# Centers of cached searches in the eight grid cells around a search's own
+# cell; results are only fetched for the one that gets reused
+SELECT_NEIGHBOR_SEARCHES_SQL = '''
+SELECT id, latitude, longitude
+FROM searches
+WHERE hash IN (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+SELECT_RECENT_SEARCHES_SQL = '''
+SELECT id, search_term, latitude, longitude, radius, sub_radius, max_workers, adapt_sub_radius, created_at
+FROM searches
+ORDER BY created_at DESC, id DESC
+LIMIT ?
+'''
+
+SELECT_SEARCH_BY_ID_SQL = '''
+SELECT s.id, s.search_term, s.latitude, s.longitude, s.radius, s.sub_radius, s.max_workers, s.adapt_sub_radius, s.min_price, s.max_price, s.open_now, s.place_type, s.created_at, r.json_data
+FROM searches s
+JOIN results r ON s.id = r.search_id
+WHERE s.id = ?
+'''
+
+DELETE_SEARCH_SQL = "DELETE FROM searches WHERE id = ?"
+
+DELETE_OLD_SEARCHES_SQL = "DELETE FROM searches WHERE created_at < ?"
 
 def hash_params(params):
     """Create a unique hash for the search parameters"""
@@ -192,277 +674,320 @@ def hash_params(params):
         params_copy['longitude'] = round(float(params_copy['longitude']), 1)
     
     # Sort parameters for consistent hashing
-    param_string = json.dumps(params_copy, sort_keys=True)
-    return hashlib.md5(param_string.encode()).hexdigest()
+    param_bytes = orjson.dumps(params_copy, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(param_bytes, digest_size=8).hexdigest()
 
-def cache_search_results(params, results):
-    """Store search results in the cache"""
-    print(f"Caching search results for '{params.get('search_term', 'unknown')}' search...")
-    conn = sqlite3.connect(DB_PATH)
+# Searches are cached per 0.1 degree grid cell (see hash_params). A search
+# just across a cell boundary from a cached one misses it, so the eight
+# neighbouring cells are also checked and a cached search is reused if its
+# center is within this fraction of the requested radius.
+CACHE_GRID_DEGREES = 0.1
+NEARBY_CACHE_MAX_OFFSET = 0.1
+
+def neighbor_cell_hashes(params):
+    """Hash the search parameters moved into each of the eight grid cells around their own"""
+    cell_lat = round(float(params['latitude']), 1)
+    cell_lng = round(float(params['longitude']), 1)
+    hashes = []
+    for lat_step in (-1, 0, 1):
+        for lng_step in (-1, 0, 1):
+            if lat_step or lng_step:
+                hashes.append(hash_params(dict(
+                    params,
+                    latitude=round(cell_lat + lat_step * CACHE_GRID_DEGREES, 1),
+                    longitude=round(cell_lng + lng_step * CACHE_GRID_DEGREES, 1)
+                )))
+    return hashes
+
+def distance_meters(lat1, lng1, lat2, lng2):
+    """Approximate distance between two nearby points in meters"""
+    # 1 degree of latitude is about 111,111 meters, longitude shrinks by cos(lat)
+    dy = (lat2 - lat1) * 111111
+    dx = (lng2 - lng1) * 111111 * math.cos(math.radians((lat1 + lat2) / 2))
+    return math.hypot(dx, dy)
+
+def cached_search_from_row(row):
+    """Build a cached search response from a searches/results join row"""
+    search_info = {
+        'id': row[0],
+        'search_term': row[1],
+        'latitude': row[2],
+        'longitude': row[3],
+        'radius': row[4],
+        'sub_radius': row[5],
+        'max_workers': row[6],
+        'adapt_sub_radius': bool(row[7]),
+        'min_price': row[8],
+        'max_price': row[9],
+        'open_now': bool(row[10]) if row[10] is not None else None,
+        'place_type': row[11],
+        'created_at': format_timestamp(row[12])
+    }
+    return {
+        'search': search_info,
+        # Raw JSON bytes, so responses can include them without re-encoding
+        'results_json': decode_results_json(row[13]),
+        'cached': True
+    }
+
+def cache_search_results(params, results, param_hash=None):
+    """Store search results in the cache, under param_hash if the caller already computed it"""
+    logger.debug("Caching search results for '%s' search...", params.get('search_term', 'unknown'))
+    conn = acquire_db_connection()
     cursor = conn.cursor()
     
     try:
         # Create a hash of parameters for lookup
-        param_hash = hash_params(params)
-        print(f"Parameter hash: {param_hash}")
+        if param_hash is None:
+            param_hash = hash_params(params)
+        logger.debug("Parameter hash: %s", param_hash)
         
-        # Check if this search already exists
-        cursor.execute("SELECT id FROM searches WHERE hash = ?", (param_hash,))
-        existing = cursor.fetchone()
+        # Insert the search, or refresh the timestamp if it is already cached
+        cursor.execute(UPSERT_SEARCH_SQL, (
+            params.get('search_term', ''),
+            params.get('latitude', 0),
+            params.get('longitude', 0),
+            params.get('radius', 0),
+            params.get('sub_radius', 3000),
+            params.get('max_workers', 5),
+            params.get('adapt_sub_radius', True),
+            params.get('min_price'),
+            params.get('max_price'),
+            params.get('open_now'),
+            params.get('place_type'),
+            int(time.time()),
+            param_hash
+        ))
         
-        if existing:
-            search_id = existing[0]
-            print(f"Updating existing search with ID {search_id}")
-            # Update the timestamp
-            cursor.execute("UPDATE searches SET created_at = ? WHERE id = ?", 
-                          (datetime.now().isoformat(), search_id))
-            print("Timestamp updated")
-        else:
-            # Insert new search
-            print("Creating new search record")
-            cursor.execute('''
-            INSERT INTO searches 
-            (search_term, latitude, longitude, radius, sub_radius, max_workers, adapt_sub_radius, min_price, max_price, open_now, place_type, created_at, hash)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                params.get('search_term', ''),
-                params.get('latitude', 0),
-                params.get('longitude', 0),
-                params.get('radius', 0),
-                params.get('sub_radius', 3000),
-                params.get('max_workers', 5),
-                params.get('adapt_sub_radius', True),
-                params.get('min_price'),
-                params.get('max_price'),
-                params.get('open_now'),
-                params.get('place_type'),
-                datetime.now().isoformat(),
-                param_hash
-            ))
-            search_id = cursor.lastrowid
-            print(f"New search created with ID {search_id}")
-            
-            # Insert results
-            print(f"Inserting {len(results) if isinstance(results, list) else 'non-list'} results")
-            cursor.execute('''
-            INSERT INTO results (search_id, json_data)
-            VALUES (?, ?)
-            ''', (search_id, json.dumps(results)))
-            print("Results inserted")
+        # Store the results against that search, replacing any older results
+        cursor.execute(UPSERT_RESULTS_SQL, (param_hash, encode_results(results)))
         
         conn.commit()
-        print("Database changes committed")
-        
-        # Verify the search was saved
-        cursor.execute("SELECT COUNT(*) FROM searches")
-        total_searches = cursor.fetchone()[0]
-        print(f"Total searches in database: {total_searches}")
+        logger.debug("Database changes committed")
+        clear_memoized_reads()
         
         return True
     except Exception as e:
-        print(f"Error caching search results: {e}")
+        logger.error(f"Error caching search results: {e}")
         conn.rollback()
         return False
     finally:
-        conn.close()
+        release_db_connection(conn)
 
-def get_cached_results(params):
-    """Get cached search results if they exist"""
-    conn = sqlite3.connect(DB_PATH)
+# Short-lived in-memory copies of frequent reads, so repeated lookups and
+# dashboard polls within a few seconds do not each query SQLite. Any write
+# to the cache clears them.
+CACHED_RESULTS_TTL = 10
+DB_STATS_TTL = 2
+RECENT_SEARCHES_TTL = 2
+MEMOIZED_RESULTS_MAX = 256
+memoized_results = {}
+memoized_db_stats = {'expires': 0, 'stats': None}
+memoized_recent_searches = {'expires': 0, 'limit': None, 'searches': None}
+memo_lock = threading.Lock()
+
+def get_memoized_results(param_hash):
+    """Return memoized cached results for a parameter hash if they have not expired"""
+    with memo_lock:
+        entry = memoized_results.get(param_hash)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+def memoize_results(param_hash, cached):
+    """Remember cached results for a parameter hash for CACHED_RESULTS_TTL seconds"""
+    now = time.monotonic()
+    with memo_lock:
+        if len(memoized_results) >= MEMOIZED_RESULTS_MAX:
+            for key in [key for key, (expires, _) in memoized_results.items() if expires <= now]:
+                del memoized_results[key]
+            if len(memoized_results) >= MEMOIZED_RESULTS_MAX:
+                memoized_results.clear()
+        memoized_results[param_hash] = (now + CACHED_RESULTS_TTL, cached)
+
+def clear_memoized_reads():
+    """Forget memoized reads after the cache has been modified"""
+    with memo_lock:
+        memoized_results.clear()
+        memoized_db_stats['expires'] = 0
+        memoized_db_stats['stats'] = None
+        memoized_recent_searches['expires'] = 0
+        memoized_recent_searches['searches'] = None
+
+# Searches that found nothing are cached too, so repeating a fruitless search
+# does not run the whole grid search again, but only for a few minutes: an
+# empty list may come from a transient Places API error rather than an area
+# with no matching businesses.
+EMPTY_RESULTS_TTL = 300
+
+def is_expired_empty_result(created_at, results_json):
+    """Whether cached results are an empty list stored more than EMPTY_RESULTS_TTL seconds ago"""
+    return results_json == b'[]' and created_at < time.time() - EMPTY_RESULTS_TTL
+
+def get_cached_results(params, param_hash=None):
+    """Get cached search results if they exist, looked up by param_hash if the caller already computed it"""
+    if param_hash is None:
+        param_hash = hash_params(params)
+    
+    memoized = get_memoized_results(param_hash)
+    if memoized is not None:
+        return memoized
+    
+    conn = acquire_db_connection()
     cursor = conn.cursor()
     
     try:
-        param_hash = hash_params(params)
-        
-        # Log the cache lookup
-        rounded_lat = round(float(params.get('latitude', 0)), 1)
-        rounded_lng = round(float(params.get('longitude', 0)), 1)
-        print(f"Looking for cached results with hash {param_hash} (coords rounded to {rounded_lat}, {rounded_lng})")
+        # Log the cache lookup; %.1f formats the grid cell only if debug logging is on
+        logger.debug("Looking for cached results with hash %s (grid cell %.1f, %.1f)", param_hash, params['latitude'], params['longitude'])
         
         # Get the search and results
-        cursor.execute('''
-        SELECT s.id, s.search_term, s.latitude, s.longitude, s.radius, s.sub_radius, s.max_workers, s.adapt_sub_radius, s.min_price, s.max_price, s.open_now, s.place_type, s.created_at, r.json_data
-        FROM searches s
-        JOIN results r ON s.id = r.search_id
-        WHERE s.hash = ?
-        ''', (param_hash,))
+        cursor.execute(SELECT_SEARCH_BY_HASH_SQL, (param_hash,))
         
         result = cursor.fetchone()
         
         if result:
-            search_info = {
-                'id': result[0],
-                'search_term': result[1],
-                'latitude': result[2],
-                'longitude': result[3],
-                'radius': result[4],
-                'sub_radius': result[5],
-                'max_workers': result[6],
-                'adapt_sub_radius': bool(result[7]),
-                'min_price': result[8],
-                'max_price': result[9],
-                'open_now': bool(result[10]) if result[10] is not None else None,
-                'place_type': result[11],
-                'created_at': result[12]
-            }
-            return {
-                'search': search_info,
-                'results': json.loads(result[13]),
-                'cached': True
-            }
+            cached = cached_search_from_row(result)
+            if is_expired_empty_result(result[12], cached['results_json']):
+                logger.debug("Cached search %s found nothing and has expired, searching again", result[0])
+                return None
+            memoize_results(param_hash, cached)
+            return cached
+        
+        # Fall back to the closest cached search in a neighbouring grid cell
+        cursor.execute(SELECT_NEIGHBOR_SEARCHES_SQL, neighbor_cell_hashes(params))
+        latitude = float(params['latitude'])
+        longitude = float(params['longitude'])
+        nearby = [
+            (distance_meters(latitude, longitude, lat, lng), search_id)
+            for search_id, lat, lng in cursor.fetchall()
+        ]
+        max_offset = float(params['radius']) * NEARBY_CACHE_MAX_OFFSET
+        nearby = [(distance, search_id) for distance, search_id in nearby if distance <= max_offset]
+        if nearby:
+            distance, search_id = min(nearby)
+            cursor.execute(SELECT_SEARCH_BY_ID_SQL, (search_id,))
+            result = cursor.fetchone()
+            if result:
+                cached = cached_search_from_row(result)
+                if is_expired_empty_result(result[12], cached['results_json']):
+                    return None
+                logger.debug("Reusing cached search %s from a neighbouring cell, %.0f m away", search_id, distance)
+                # Not memoized: other points in this cell may be too far from it
+                return cached
         return None
     except Exception as e:
-        print(f"Error retrieving cached results: {e}")
+        logger.error(f"Error retrieving cached results: {e}")
         return None
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 def get_recent_searches(limit=10):
     """Get a list of recent searches"""
-    print(f"Getting recent searches (limit={limit})...")
-    conn = sqlite3.connect(DB_PATH)
+    with memo_lock:
+        if (memoized_recent_searches['expires'] > time.monotonic()
+                and memoized_recent_searches['limit'] == limit):
+            return memoized_recent_searches['searches']
+    
+    conn = acquire_db_connection()
     cursor = conn.cursor()
+    cursor.row_factory = sqlite3.Row
     
     try:
-        # First check if there are any searches at all
-        cursor.execute("SELECT COUNT(*) FROM searches")
-        count = cursor.fetchone()[0]
-        print(f"Found {count} total searches in database")
-        
         # Get the most recent searches
-        cursor.execute('''
-        SELECT id, search_term, latitude, longitude, radius, sub_radius, max_workers, adapt_sub_radius, created_at
-        FROM searches
-        ORDER BY created_at DESC
-        LIMIT ?
-        ''', (limit,))
-        
-        rows = cursor.fetchall()
-        print(f"Retrieved {len(rows)} recent searches")
+        cursor.execute(SELECT_RECENT_SEARCHES_SQL, (limit,))
         
         searches = []
-        for row in rows:
-            searches.append({
-                'id': row[0],
-                'search_term': row[1],
-                'latitude': row[2],
-                'longitude': row[3],
-                'radius': row[4],
-                'sub_radius': row[5],
-                'max_workers': row[6],
-                'adapt_sub_radius': bool(row[7]),
-                'created_at': row[8]
-            })
+        for row in cursor:
+            search = dict(row)
+            search['adapt_sub_radius'] = bool(search['adapt_sub_radius'])
+            search['created_at'] = format_timestamp(search['created_at'])
+            searches.append(search)
         
-        print(f"Returning {len(searches)} formatted searches")
+        logger.debug("Retrieved %s recent searches (limit=%s)", len(searches), limit)
+        with memo_lock:
+            memoized_recent_searches['expires'] = time.monotonic() + RECENT_SEARCHES_TTL
+            memoized_recent_searches['limit'] = limit
+            memoized_recent_searches['searches'] = searches
         return searches
     except Exception as e:
-        print(f"Error retrieving recent searches: {e}")
+        logger.error(f"Error retrieving recent searches: {e}")
         return []
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 def get_search_by_id(search_id):
     """Get a specific search and its results by ID"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = acquire_db_connection()
     cursor = conn.cursor()
     
     try:
         # Get the search and results
-        cursor.execute('''
-        SELECT s.id, s.search_term, s.latitude, s.longitude, s.radius, s.sub_radius, s.max_workers, s.adapt_sub_radius, s.min_price, s.max_price, s.open_now, s.place_type, s.created_at, r.json_data
-        FROM searches s
-        JOIN results r ON s.id = r.search_id
-        WHERE s.id = ?
-        ''', (search_id,))
+        cursor.execute(SELECT_SEARCH_BY_ID_SQL, (search_id,))
         
         result = cursor.fetchone()
         
         if result:
-            search_info = {
-                'id': result[0],
-                'search_term': result[1],
-                'latitude': result[2],
-                'longitude': result[3],
-                'radius': result[4],
-                'sub_radius': result[5],
-                'max_workers': result[6],
-                'adapt_sub_radius': bool(result[7]),
-                'min_price': result[8],
-                'max_price': result[9],
-                'open_now': bool(result[10]) if result[10] is not None else None,
-                'place_type': result[11],
-                'created_at': result[12]
-            }
-            return {
-                'search': search_info,
-                'results': json.loads(result[13]),
-                'cached': True
-            }
+            return cached_search_from_row(result)
         return None
     except Exception as e:
-        print(f"Error retrieving search by ID: {e}")
+        logger.error(f"Error retrieving search by ID: {e}")
         return None
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 def delete_search(search_id):
     """Delete a search and its results from the database"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = acquire_db_connection()
     cursor = conn.cursor()
     
     try:
-        # Enable foreign keys for cascading delete
-        cursor.execute("PRAGMA foreign_keys = ON")
-        
         # Delete the search (results will be deleted via cascade)
-        cursor.execute("DELETE FROM searches WHERE id = ?", (search_id,))
+        cursor.execute(DELETE_SEARCH_SQL, (search_id,))
         
         # Check if any rows were affected
         rows_affected = cursor.rowcount
         conn.commit()
+        clear_memoized_reads()
         return rows_affected > 0
     except Exception as e:
-        print(f"Error deleting search {search_id}: {e}")
+        logger.error(f"Error deleting search {search_id}: {e}")
         conn.rollback()
         return False
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 def clean_old_searches(days=30):
     """Delete searches older than the specified number of days"""
-    conn = sqlite3.connect(DB_PATH)
+    conn = acquire_db_connection()
     cursor = conn.cursor()
     
     try:
-        # Enable foreign keys for cascading delete
-        cursor.execute("PRAGMA foreign_keys = ON")
-        
         # Calculate the cutoff date
-        cutoff_date = (datetime.now() - timedelta(days=days)).isoformat()
+        cutoff_timestamp = int(time.time()) - days * 24 * 60 * 60
         
-        # Find searches to delete
-        cursor.execute("SELECT id FROM searches WHERE created_at < ?", (cutoff_date,))
-        old_searches = cursor.fetchall()
-        
-        # Delete old searches
-        cursor.execute("DELETE FROM searches WHERE created_at < ?", (cutoff_date,))
+        # Delete old searches (their results are removed via cascade)
+        cursor.execute(DELETE_OLD_SEARCHES_SQL, (cutoff_timestamp,))
         
         deleted_count = cursor.rowcount
         conn.commit()
+        clear_memoized_reads()
         
-        print(f"Cleaned up {deleted_count} searches older than {days} days")
+        logger.info(f"Cleaned up {deleted_count} searches older than {days} days")
         return deleted_count
     except Exception as e:
-        print(f"Error cleaning old searches: {e}")
+        logger.error(f"Error cleaning old searches: {e}")
         conn.rollback()
         return 0
     finally:
-        conn.close()
+        release_db_connection(conn)
 
 def get_db_stats():
     """Get database statistics"""
-    conn = sqlite3.connect(DB_PATH)
+    with memo_lock:
+        if memoized_db_stats['expires'] > time.monotonic():
+            return memoized_db_stats['stats']
+    
+    conn = acquire_db_connection()
     cursor = conn.cursor()
     
     try:
@@ -485,21 +1010,92 @@ def get_db_stats():
         # Get database size
         db_size = os.path.getsize(DB_PATH) / (1024 * 1024)  # Size in MB
         
-        return {
+        stats = {
             'search_count': search_count,
             'result_count': result_count,
-            'oldest_date': oldest_date,
-            'newest_date': newest_date,
+            'oldest_date': format_timestamp(oldest_date),
+            'newest_date': format_timestamp(newest_date),
             'db_size_mb': round(db_size, 2)
         }
+        with memo_lock:
+            memoized_db_stats['expires'] = time.monotonic() + DB_STATS_TTL
+            memoized_db_stats['stats'] = stats
+        return stats
     except Exception as e:
-        print(f"Error getting database stats: {e}")
+        logger.error(f"Error getting database stats: {e}")
         return None
     finally:
-        conn.close()
+        release_db_connection(conn)
+
+# Placeholder in index.html that is replaced with the Google Maps API key
+API_KEY_PLACEHOLDER = 'YOUR_API_KEY_PLACEHOLDER'
+
+# index.html with the API key injected, rebuilt only when the file or key changes
+index_html_cache = {'mtime': None, 'api_key': None, 'content': None, 'content_gzip': None}
+index_html_lock = threading.Lock()
+
+def get_index_html(api_key, gzipped=False):
+    """Return the index.html bytes with the Google Maps API key injected, optionally gzip-compressed"""
+    index_path = os.path.join(os.getcwd(), 'index.html')
+    mtime = os.stat(index_path).st_mtime
+    
+    with index_html_lock:
+        if (index_html_cache['content'] is None
+                or index_html_cache['mtime'] != mtime
+                or index_html_cache['api_key'] != api_key):
+            # Read the HTML file and replace the placeholder with the API key
+            with open(index_path, 'r') as file:
+                html_content = file.read()
+            modified_content = html_content.replace(API_KEY_PLACEHOLDER, api_key)
+            
+            index_html_cache['mtime'] = mtime
+            index_html_cache['api_key'] = api_key
+            index_html_cache['content'] = modified_content.encode('utf-8')
+            index_html_cache['content_gzip'] = gzip.compress(index_html_cache['content'], compresslevel=9)
+        
+        return index_html_cache['content_gzip' if gzipped else 'content']
+
+# Largest POST body accepted; search parameters are well under a kilobyte
+MAX_POST_BODY_SIZE = 1024 * 1024
+
+# Size of the handler's buffered wfile. Headers and a body up to this size go
+# out in the single write made when the request finishes, so a small response
+# is one send instead of two; larger bodies bypass the buffer
+RESPONSE_BUFFER_SIZE = 64 * 1024
+
+# JSON responses at least this big are gzipped for clients that accept it.
+# Result lists repeat the same keys for every business and shrink several
+# times over even at the fastest compression level.
+GZIP_MIN_RESPONSE_SIZE = 1024
+JSON_GZIP_LEVEL = 1
 
 class BusinessFinderHandler(SimpleHTTPRequestHandler):
     """HTTP request handler for Business Finder web app"""
+    
+    # Keep connections open between requests from the same browser
+    protocol_version = 'HTTP/1.1'
+    
+    # Set TCP_NODELAY so small responses and stream batches are not held back
+    # by Nagle's algorithm waiting for the client's delayed ACK
+    disable_nagle_algorithm = True
+    
+    # Buffer responses instead of sending each header line and body separately
+    wbufsize = RESPONSE_BUFFER_SIZE
+    
+    # POST API endpoints, mapped to the handler method that serves them
+    POST_ROUTES = {
+        "/api/search": "handle_search",
+        "/api/recent_searches": "handle_recent_searches",
+        "/api/db_stats": "handle_db_stats",
+        "/api/search_logs": "handle_search_logs",
+        "/api/diagnostics": "handle_diagnostics",
+    }
+    POST_PREFIX_ROUTES = (
+        ("/api/search_by_id/", "handle_search_by_id"),
+        ("/api/delete_search/", "handle_delete_search"),
+        ("/api/clean_old_searches/", "handle_clean_old_searches"),
+        ("/api/sheets_export/", "handle_sheets_export"),
+    )
 
     def do_GET(self):
         """Handle GET requests - serve static files"""
@@ -507,56 +1103,93 @@ class BusinessFinderHandler(SimpleHTTPRequestHandler):
         if self.path == '/':
             self.path = '/index.html'
             
-        # Get API key from environment/config
-        api_key = get_api_key()
-        
         # Special handling for index.html to inject API key
         if self.path.endswith('index.html'):
+            # Only the page needs the key; static assets skip the lookup
+            api_key = get_cached_api_key()
             if api_key:
-                print(f"Using API key: {api_key[:5]}...")
+                logger.debug("Using API key: %s...", api_key[:5])
+                accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+                content = get_index_html(api_key, gzipped=accepts_gzip)
+                
                 self.send_response(200)
                 self.send_header('Content-type', 'text/html')
-                self.end_headers()
+                if accepts_gzip:
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Vary', 'Accept-Encoding')
+                self.send_header('Content-Length', str(len(content)))
                 
-                # Read the HTML file
-                with open(os.path.join(os.getcwd(), 'index.html'), 'r') as file:
-                    html_content = file.read()
-                
-                # Replace the placeholder with the API key
-                modified_content = html_content.replace('YOUR_API_KEY_PLACEHOLDER', api_key)
-                
-                # Send the modified content
-                self.wfile.write(modified_content.encode('utf-8'))
+                # Send the page with the API key already injected
+                self.end_headers()
+                self.wfile.write(content)
                 return
             else:
-                print("Warning: No API key found, Google Maps will not work correctly")
+                logger.warning("No API key found, Google Maps will not work correctly")
         
         # Serve static files for all other requests
         return SimpleHTTPRequestHandler.do_GET(self)
 
+    def log_message(self, format, *args):
+        """Send per-request access log lines to the server logger at DEBUG instead of stderr"""
+        logger.debug("%s - " + format, self.address_string(), *args)
+    
+    def log_error(self, format, *args):
+        """Log request errors (bad requests, timeouts) as warnings"""
+        logger.warning("%s - " + format, self.address_string(), *args)
+
+    def copyfile(self, source, outputfile):
+        """Copy static files straight to the socket, using sendfile() where available"""
+        if outputfile is self.wfile:
+            # The buffered headers must reach the socket before the file does;
+            # socket.sendfile() falls back to plain sends if os.sendfile is unsupported
+            self.wfile.flush()
+            self.connection.sendfile(source)
+        else:
+            SimpleHTTPRequestHandler.copyfile(self, source, outputfile)
+
+    def send_json_response(self, body, status=200):
+        """Send an already-encoded JSON body, gzipped if large and accepted, with a Content-Length so the connection can be reused"""
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Access-Control-Allow-Origin', '*')  # Enable CORS
+        if len(body) >= GZIP_MIN_RESPONSE_SIZE:
+            self.send_header('Vary', 'Accept-Encoding')
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = gzip.compress(body, compresslevel=JSON_GZIP_LEVEL)
+                self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_POST(self):
         """Handle POST requests - API endpoints"""
-        if self.path == "/api/search":
-            self.handle_search()
-        elif self.path == "/api/recent_searches":
-            self.handle_recent_searches()
-        elif self.path.startswith("/api/search_by_id/"):
-            search_id = self.path.split("/")[-1]
-            self.handle_search_by_id(search_id)
-        elif self.path.startswith("/api/delete_search/"):
-            search_id = self.path.split("/")[-1]
-            self.handle_delete_search(search_id)
-        elif self.path == "/api/db_stats":
-            self.handle_db_stats()
-        elif self.path.startswith("/api/clean_old_searches/"):
-            days = self.path.split("/")[-1]
-            self.handle_clean_old_searches(days)
-        elif self.path == "/api/search_logs":
-            self.handle_search_logs()
-        elif self.path == "/api/diagnostics":
-            self.handle_diagnostics()
-        else:
-            self.send_error(404, "Not Found")
+        # Always consume the request body, otherwise its bytes would be read as
+        # the next request on a kept-alive connection
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = -1
+        if content_length < 0:
+            self.send_error(400, "Invalid Content-Length")
+            return
+        # Refuse oversized bodies before allocating them (send_error closes the connection)
+        if content_length > MAX_POST_BODY_SIZE:
+            self.send_error(413, "Request body too large")
+            return
+        self.post_body = self.rfile.read(content_length)
+        
+        handler_name = self.POST_ROUTES.get(self.path)
+        if handler_name:
+            getattr(self, handler_name)()
+            return
+        
+        # Routes that take the last path segment as their argument
+        for prefix, handler_name in self.POST_PREFIX_ROUTES:
+            if self.path.startswith(prefix):
+                getattr(self, handler_name)(self.path[len(prefix):])
+                return
+        
+        self.send_error(404, "Not Found")
             
     def handle_delete_search(self, search_id):
         """Handle deletion of a search"""
@@ -564,36 +1197,25 @@ class BusinessFinderHandler(SimpleHTTPRequestHandler):
             search_id = int(search_id)
             success = delete_search(search_id)
             
-            # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
             # Return result
             result = {'success': success, 'id': search_id}
-            self.wfile.write(json.dumps(result).encode())
+            self.send_json_response(orjson.dumps(result))
         except ValueError:
             self.send_error(400, "Invalid search ID")
         except Exception as e:
-            print(f"Error handling delete search: {e}")
+            logger.error(f"Error handling delete search: {e}")
             self.send_error(500, f"Internal Server Error: {str(e)}")
             
     def handle_db_stats(self):
         """Handle database statistics request"""
         try:
+            wait_for_cache_writes()
             stats = get_db_stats()
             
-            # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
             # Return result
-            self.wfile.write(json.dumps(stats).encode())
+            self.send_json_response(orjson.dumps(stats))
         except Exception as e:
-            print(f"Error handling database stats: {e}")
+            logger.error(f"Error handling database stats: {e}")
             self.send_error(500, f"Internal Server Error: {str(e)}")
             
     def handle_clean_old_searches(self, days_str):
@@ -606,34 +1228,45 @@ class BusinessFinderHandler(SimpleHTTPRequestHandler):
                 
             deleted_count = clean_old_searches(days)
             
-            # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
             # Return result
             result = {'success': True, 'deleted_count': deleted_count, 'days': days}
-            self.wfile.write(json.dumps(result).encode())
+            self.send_json_response(orjson.dumps(result))
         except ValueError:
             self.send_error(400, "Invalid days parameter")
         except Exception as e:
-            print(f"Error handling clean old searches: {e}")
+            logger.error(f"Error handling clean old searches: {e}")
+            self.send_error(500, f"Internal Server Error: {str(e)}")
+            
+    def handle_sheets_export(self, job_id):
+        """Report whether a Google Sheets export has finished, with its result once it has"""
+        try:
+            future = pop_finished_sheets_export(job_id)
+            if future is None:
+                self.send_error(404, "Unknown export job")
+                return
+            
+            if not future.done():
+                result = {'success': True, 'status': 'pending', 'job_id': job_id}
+                self.send_json_response(orjson.dumps(result))
+                return
+            
+            status, result = future.result()
+            self.send_json_response(orjson.dumps(result), status=status)
+        except Exception as e:
+            logger.error(f"Error handling sheets export: {e}")
             self.send_error(500, f"Internal Server Error: {str(e)}")
             
     def handle_recent_searches(self):
         """Return a list of recent searches"""
         try:
+            # Include a search whose results are still being cached
+            wait_for_cache_writes()
             recent_searches = get_recent_searches(20)
             
             # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(recent_searches).encode())
+            self.send_json_response(orjson.dumps(recent_searches))
         except Exception as e:
-            print(f"Error getting recent searches: {e}")
+            logger.error(f"Error getting recent searches: {e}")
             self.send_error(500, f"Internal Server Error: {str(e)}")
     
     def handle_search_logs(self):
@@ -643,13 +1276,9 @@ class BusinessFinderHandler(SimpleHTTPRequestHandler):
             logs = get_search_logs()
             
             # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps(logs).encode())
+            self.send_json_response(orjson.dumps(logs))
         except Exception as e:
-            print(f"Error getting search logs: {e}")
+            logger.error(f"Error getting search logs: {e}")
             self.send_error(500, f"Internal Server Error: {str(e)}")
         
     def handle_search_by_id(self, search_id):
@@ -660,23 +1289,24 @@ class BusinessFinderHandler(SimpleHTTPRequestHandler):
             
             if search_data:
                 # Send response
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                self.wfile.write(json.dumps(search_data).encode())
+                # Splice the stored results JSON in rather than decoding and re-encoding it
+                self.send_json_response(
+                    b'{"search":' + orjson.dumps(search_data['search'])
+                    + b',"results":' + search_data['results_json']
+                    + b',"cached":true}'
+                )
             else:
                 self.send_error(404, "Search not found")
         except ValueError:
             self.send_error(400, "Invalid search ID")
         except Exception as e:
-            print(f"Error getting search by ID: {e}")
+            logger.error(f"Error getting search by ID: {e}")
             self.send_error(500, f"Internal Server Error: {str(e)}")
             
     def handle_diagnostics(self):
         """Handle diagnostic requests for debugging database issues"""
+        conn = acquire_db_connection()
         try:
-            conn = sqlite3.connect(DB_PATH)
             cursor = conn.cursor()
             
             # Get table structure
@@ -697,33 +1327,92 @@ class BusinessFinderHandler(SimpleHTTPRequestHandler):
                 'max_workers': 5
             }
             
-            # Send response
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
             diagnostic_info = {
                 "column_names": column_names,
                 "migration_applied": True,
                 "database_path": DB_PATH
             }
             
-            self.wfile.write(json.dumps(diagnostic_info).encode())
+            # Send response
+            self.send_json_response(orjson.dumps(diagnostic_info))
             
         except Exception as e:
-            print(f"Error running diagnostics: {e}")
+            logger.error(f"Error running diagnostics: {e}")
             self.send_error(500, f"Diagnostic Error: {str(e)}")
+        finally:
+            release_db_connection(conn)
+
+    def start_stream(self):
+        """Start a newline-delimited JSON response that is sent batch by batch"""
+        # Chunked transfer encoding needs HTTP/1.1 on both ends; otherwise the
+        # end of the stream is signalled by closing the connection
+        self.stream_chunked = self.protocol_version == 'HTTP/1.1' and self.request_version == 'HTTP/1.1'
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if self.stream_chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
+        # Send the headers now rather than leaving them in the wfile buffer
+        # until the first batch arrives
+        self.wfile.flush()
+    
+    def write_stream_batch(self, businesses):
+        """Send one batch of businesses as a single line of JSON"""
+        self.write_stream_line(orjson.dumps(businesses))
+    
+    def write_stream_line(self, body):
+        """Send one already-encoded JSON value as a line of the stream"""
+        line = body + b'\n'
+        if self.stream_chunked:
+            line = f'{len(line):X}\r\n'.encode() + line + b'\r\n'
+        self.wfile.write(line)
+        self.wfile.flush()
+    
+    def end_stream(self):
+        """Finish a streamed response"""
+        if self.stream_chunked:
+            self.wfile.write(b'0\r\n\r\n')
+            self.wfile.flush()
+
+    def relay_stream(self, batch_queue, search_future):
+        """Send a streamed search's batches to the client as the search pool produces them"""
+        deadline = time.monotonic() + SEARCH_TIMEOUT
+        try:
+            self.start_stream()
+            while True:
+                try:
+                    batch = batch_queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    logger.warning("Streamed search did not finish within %s seconds", SEARCH_TIMEOUT)
+                    break
+                if batch is None:
+                    # exception() waits for the pool to finish the future
+                    error = search_future.exception()
+                    if error is None:
+                        self.end_stream()
+                        return
+                    logger.error("Streamed search failed: %s", error)
+                    break
+                self.write_stream_batch(batch)
+        except ConnectionError as e:
+            # The search carries on in the pool and its results are still cached
+            logger.info("Client disconnected from streamed search: %s", e)
+        
+        # The headers are already sent, so no error page can follow; closing the
+        # connection without the final chunk tells the client the response is
+        # incomplete
+        self.close_connection = True
 
     def handle_search(self):
         """Handle search API requests"""
-        # Get request body
-        content_length = int(self.headers.get('Content-Length', 0))
-        post_body = self.rfile.read(content_length).decode('utf-8')
-        
         try:
             # Parse JSON parameters
-            params = json.loads(post_body)
+            params = orjson.loads(self.post_body)
             search_term = params.get('search_term', 'business')
             latitude = params.get('latitude')
             longitude = params.get('longitude')
@@ -738,6 +1427,8 @@ class BusinessFinderHandler(SimpleHTTPRequestHandler):
             use_cache = params.get('use_cache', True)
             # Get output format
             output_format = params.get('output_format', 'csv')
+            # Optionally stream results as newline-delimited JSON batches (not for Sheets export)
+            stream = bool(params.get('stream', False)) and output_format != 'sheets'
             
             # Get new pre-search filter parameters
             min_price = params.get('min_price')
@@ -770,10 +1461,19 @@ class BusinessFinderHandler(SimpleHTTPRequestHandler):
                 open_now = bool(open_now)
             
             # Validate parameters
-            if not all([search_term, latitude is not None, longitude is not None, radius]):
+            if not search_term or latitude is None or longitude is None or not radius:
                 self.send_error(400, "Missing required parameters")
                 return
             
+            if not all(isinstance(value, (int, float)) and not isinstance(value, bool)
+                       for value in (latitude, longitude, radius)):
+                self.send_error(400, "latitude, longitude and radius must be numbers")
+                return
+            
+            if not isinstance(search_term, str):
+                self.send_error(400, "search_term must be a string")
+                return
+            
             # Create search params dict for cache lookup (include filters for cache key)
             search_params = {
                 'search_term': search_term,
@@ -789,242 +1489,182 @@ class BusinessFinderHandler(SimpleHTTPRequestHandler):
                 'place_type': place_type
             }
             
-            # Log original coordinates before rounding
-            print(f"Original search coordinates: {latitude}, {longitude}")
-            print(f"Will be rounded to: {round(float(latitude), 1)}, {round(float(longitude), 1)} for caching")
+            # Hash the parameters once for the cache lookup, in-flight search
+            # sharing and the cache write
+            param_hash = hash_params(search_params)
+            
+            # Log the coordinates and the cache grid cell they fall in
+            logger.debug("Search coordinates: %s, %s (cached under grid cell %.1f, %.1f)", latitude, longitude, latitude, longitude)
             
             # Check cache first if enabled
             if use_cache:
-                cache_result = get_cached_results(search_params)
+                cache_result = get_cached_results(search_params, param_hash)
                 if cache_result:
-                    cached_lat = cache_result['search']['latitude']
-                    cached_lng = cache_result['search']['longitude']
+                    logger.info('Using cached results for "%s" search', search_term)
+                    logger.debug('Requested coords: %s, %s; cached search coords: %s, %s',
+                                 latitude, longitude,
+                                 cache_result['search']['latitude'], cache_result['search']['longitude'])
                     
-                    # Calculate distance between original and cached coordinates
-                    orig_lat_rounded = round(float(latitude), 1)
-                    orig_lng_rounded = round(float(longitude), 1)
-                    cached_lat_rounded = round(float(cached_lat), 1)
-                    cached_lng_rounded = round(float(cached_lng), 1)
-                    
-                    print(f'Using cached results for "{search_term}" search')
-                    print(f'Requested coords (rounded): {orig_lat_rounded}, {orig_lng_rounded}')
-                    print(f'Cached coords (rounded): {cached_lat_rounded}, {cached_lng_rounded}')
+                    if stream:
+                        # Cached results go out as a single batch
+                        self.start_stream()
+                        self.write_stream_line(cache_result['results_json'])
+                        self.end_stream()
+                        return
                     
                     # Send response with cache info
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(cache_result['results']).encode())
+                    self.send_json_response(cache_result['results_json'])
                     return
             
             # Get API key from environment
-            api_key = get_api_key()
+            api_key = get_cached_api_key()
             if not api_key:
                 self.send_error(500, "API key not found in environment")
                 return
             
             # Call business_finder directly with the parameters
-            print(f'Searching for "{search_term}" within {radius}m of coordinates [{latitude}, {longitude}]...')
-            
-            if radius > sub_radius:
-                print(f"Using grid search with sub-radius {sub_radius}m and {max_workers} parallel workers")
-                
-            businesses = search_places(
-                api_key, 
-                search_term, 
-                latitude, 
-                longitude, 
-                radius, 
-                sub_radius=sub_radius, 
-                max_workers=max_workers,
-                adapt_sub_radius=adapt_sub_radius,
-                min_price=min_price,
-                max_price=max_price,
-                open_now=open_now,
-                place_type=place_type
+            logger.info(
+                'Searching for "%s" within %sm of coordinates [%s, %s]...',
+                search_term, radius, latitude, longitude,
+                extra={
+                    'search_term': search_term,
+                    'latitude': latitude,
+                    'longitude': longitude,
+                    'radius': radius,
+                    'sub_radius': sub_radius,
+                    'place_type': place_type,
+                    'output_format': output_format
+                }
             )
             
-            # Save results to data directory
-            data_dir = os.path.join(parent_dir, 'data')
-            os.makedirs(data_dir, exist_ok=True)
-            
-            # Create a snake_case filename from the search term
-            search_term_safe = search_term.lower().replace(' ', '_')
-            # Remove any characters that aren't alphanumeric or underscore
-            search_term_safe = ''.join(c if c.isalnum() or c == '_' else '_' for c in search_term_safe)
-            # Remove consecutive underscores
-            while '__' in search_term_safe:
-                search_term_safe = search_term_safe.replace('__', '_')
-            # Remove leading/trailing underscores
-            search_term_safe = search_term_safe.strip('_')
-            
-            # Default to a simple name if the search term is empty or results in an empty string
-            if not search_term_safe:
-                search_term_safe = "business"
+            if radius > sub_radius:
+                logger.info("Using grid search with sub-radius %sm and %s parallel workers", sub_radius, max_workers)
                 
-            # Add coordinates for more context
-            lat_short = round(latitude, 2)
-            lng_short = round(longitude, 2)
+            search_args = (api_key, search_term, latitude, longitude, radius)
+            search_kwargs = {
+                'sub_radius': sub_radius,
+                'max_workers': max_workers,
+                'adapt_sub_radius': adapt_sub_radius,
+                'min_price': min_price,
+                'max_price': max_price,
+                'open_now': open_now,
+                'place_type': place_type
+            }
             
-            # Create a descriptive filename
-            results_filename = f"{search_term_safe}_at_{lat_short}_{lng_short}.json"
+            # Streamed searches run on the search pool too, handing each batch to
+            # this thread through a queue as soon as its grid points finish.
+            # Results are saved and cached when the search finishes, whatever
+            # happens to this client.
+            batch_queue = queue.Queue()
+            if stream:
+                search_future, owner = submit_search(
+                    param_hash, search_params, stream_search_places, batch_queue, *search_args, **search_kwargs
+                )
+            else:
+                search_future, owner = submit_search(
+                    param_hash, search_params, search_places, *search_args, **search_kwargs
+                )
             
-            # Save a copy to data directory
-            with open(os.path.join(data_dir, results_filename), 'w') as f:
-                json.dump(businesses, f, indent=2)
+            if stream and owner:
+                self.relay_stream(batch_queue, search_future)
+                return
             
-            # Cache the results
-            cache_result = cache_search_results(search_params, businesses)
-            print(f"Cache result: {'Success' if cache_result else 'Failed'}")
+            try:
+                businesses = search_future.result(timeout=SEARCH_TIMEOUT)
+            except concurrent.futures.TimeoutError:
+                self.send_error(504, f"Search did not finish within {SEARCH_TIMEOUT} seconds")
+                return
             
-            # Verify the search was added to the database
-            recent_searches = get_recent_searches(5)
-            print(f"Recent searches after adding: {len(recent_searches)}")
-            for s in recent_searches:
-                print(f"  - ID {s['id']}: {s['search_term']} ({s['created_at']})")
+            if stream:
+                # An identical search was already running, send its results as one batch
+                self.start_stream()
+                self.write_stream_batch(businesses)
+                self.end_stream()
+                return
             
             # Handle different output formats
             if output_format == 'sheets':
                 # For Google Sheets export, we return the sheet URL in JSON format
                 spreadsheet_name = params.get('sheets_name', f"Business Finder - {search_term}")
                 
-                # Get the project root directory
-                project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-                print(f"Project root directory: {project_root}")
-                
-                # Use credentials from project directory by default, unless explicitly specified
-                credentials_path = params.get('sheets_credentials')
-                if not credentials_path:
-                    credentials_path = os.path.join(project_root, 'credentials', 'client_secret.json')
-                
-                token_path = params.get('sheets_token')
-                if not token_path and credentials_path:
-                    token_path = os.path.join(os.path.dirname(credentials_path), 'token.json')
-                    
-                # Verify credentials exist
-                if os.path.exists(credentials_path):
-                    print(f"Found credentials file at: {credentials_path}")
-                    print(f"File size: {os.path.getsize(credentials_path)} bytes")
-                else:
-                    print(f"WARNING: Credentials file not found at: {credentials_path}")
-                    
-                # Verify token exists
-                if os.path.exists(token_path):
-                    print(f"Found token file at: {token_path}")
-                    print(f"File size: {os.path.getsize(token_path)} bytes")
-                else:
-                    print(f"Token file not found at: {token_path} (not an error if first run)")
-                
-                # Import the export function from business_finder
-                from business_finder.exporters.sheets_exporter import export_to_sheets
-                
-                # When in debug mode, print more info
-                print(f"=== SHEETS EXPORT: SERVER DEBUG ===")
-                print(f"Businesses count: {len(businesses)}")
-                print(f"Spreadsheet name: {spreadsheet_name}")
-                print(f"Credentials path: {credentials_path}")
-                print(f"Token path: {token_path}")
-                print(f"=================================")
-                
-                try:
-                    # Export results to Google Sheets
-                    print(f"Exporting to Google Sheets: {len(businesses)} businesses")
-                    
-                    # Don't create dummy data - if no businesses found, export empty sheet
-                    if not businesses:
-                        print("WARNING: No businesses found for the search criteria")
-                        # Continue with empty list - Google Sheets export will handle this
-                    
-                    # Try export with verbose error handling
-                    print("Calling export_to_sheets function with valid parameters...")
-                    
-                    # Force using test credentials for debugging
-                    from pathlib import Path
-                    project_root = Path(__file__).resolve().parent.parent
-                    credentials_path = str(project_root / "credentials" / "client_secret.json")
-                    token_path = str(project_root / "credentials" / "token.json")
-                    
-                    print(f"Using fixed credential paths:")
-                    print(f"Credentials: {credentials_path} (exists: {os.path.exists(credentials_path)})")
-                    print(f"Token: {token_path} (exists: {os.path.exists(token_path)})")
-                    
-                    sheet_url = export_to_sheets(
-                        businesses, 
-                        spreadsheet_name=spreadsheet_name,
-                        credentials_path=credentials_path,
-                        token_path=token_path
-                    )
-                    
-                    print(f"Successfully exported to Google Sheets: {sheet_url}")
-                    
-                    # Send response with the URL
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')  # Enable CORS
-                    self.end_headers()
-                    
-                    # Send the URL as JSON
-                    self.wfile.write(json.dumps({
-                        'success': True,
-                        'url': sheet_url
-                    }).encode())
-                except Exception as e:
-                    print(f"Error exporting to Google Sheets: {e}")
-                    error_message = str(e)
-                    
-                    # Check for specific API errors
-                    if 'Google Drive API has not been used' in error_message:
-                        error_message = "Google Drive API is not enabled. Please visit the Google Cloud Console to enable it."
-                    elif 'access_denied' in error_message:
-                        error_message = "OAuth consent screen access denied. Make sure your email is added as a test user in the Google Cloud Console."
-                    
-                    # Log detailed error for debugging
-                    import traceback
-                    print(f"Detailed error: {traceback.format_exc()}")
-                    
-                    # Return proper error response instead of mock data
-                    self.send_response(500)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Access-Control-Allow-Origin', '*')  # Enable CORS
-                    self.end_headers()
-                    
-                    # Send proper error response
-                    self.wfile.write(json.dumps({
-                        'success': False,
-                        'error': error_message,
-                        'fix_instructions': "To fix Google Sheets export issues, please enable both Google Sheets API and Google Drive API in your Google Cloud Console and ensure proper OAuth credentials are configured."
-                    }).encode())
+                # The export can take a long time (OAuth consent, Drive API calls),
+                # so it runs in the background and the page polls for the result.
+                # Credentials always come from the project's credentials directory:
+                # the exporter creates directories and writes the OAuth token at
+                # these paths, so they must never come from the request.
+                job_id = submit_sheets_export(businesses, spreadsheet_name, CREDENTIALS_PATH, TOKEN_PATH)
+                self.send_json_response(orjson.dumps({
+                    'success': True,
+                    'status': 'pending',
+                    'job_id': job_id
+                }), status=202)
             else:
-                # For CSV and JSON formats, send the raw data
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')  # Enable CORS
-                self.end_headers()
-                
-                # Convert to JSON and send
-                self.wfile.write(json.dumps(businesses).encode())
+                # For CSV and JSON formats, send the raw data as JSON
+                self.send_json_response(orjson.dumps(businesses))
             
-        except json.JSONDecodeError:
+        except ConnectionError as e:
+            # The client went away; there is nobody left to send an error to
+            logger.info("Client disconnected during search request: %s", e)
+            self.close_connection = True
+        except orjson.JSONDecodeError:
             self.send_error(400, "Invalid JSON")
         except Exception as e:
-            print(f"Error processing request: {e}")
+            logger.error(f"Error processing request: {e}")
             self.send_error(500, f"Internal Server Error: {str(e)}")
 
+class BusinessFinderServer(ThreadingHTTPServer):
+    """Threaded HTTP server that handles each connection on its own daemon thread"""
+    
+    # Let bursts of browser connections queue in the kernel instead of being
+    # refused once the default backlog of 5 is full
+    request_queue_size = 128
+    
+    # Don't let handlers waiting on a long search keep the process alive on shutdown
+    daemon_threads = True
+
 def run_server(port=PORT):
     """Run the HTTP server"""
     # Change to the web directory to serve files from there
     web_dir = os.path.dirname(os.path.abspath(__file__))
     os.chdir(web_dir)
     
+    # Start the background log writer, at BUSINESS_FINDER_LOG_LEVEL if it names a level
+    log_level = os.environ.get('BUSINESS_FINDER_LOG_LEVEL', 'INFO').upper()
+    if not isinstance(logging.getLevelName(log_level), int):
+        log_level = logging.INFO
+    log_listener = setup_logging(log_level)
+    
     # Initialize the database
     init_database()
     
+    # Start the background writer for search result files
+    start_results_writer()
+    
+    # Refresh planner statistics now and then once a day
+    optimize_database()
+    start_db_maintenance()
+    
+    # Load the API key and render index.html (plain and gzipped) before the
+    # first browser request
+    api_key = get_cached_api_key()
+    if api_key:
+        get_index_html(api_key)
+    else:
+        logger.warning("No API key found, searches and Google Maps will not work until one is configured")
+    
+    # Reload the API key from config on SIGHUP (not available on Windows)
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, reload_api_key)
+    
     server_address = ('', port)
-    httpd = HTTPServer(server_address, BusinessFinderHandler)
-    print(f"Starting Business Finder server on port {port}...")
-    print(f"Open http://localhost:{port} in your browser")
-    httpd.serve_forever()
+    httpd = BusinessFinderServer(server_address, BusinessFinderHandler)
+    logger.info(f"Starting Business Finder server on port {port}...")
+    logger.info(f"Open http://localhost:{port} in your browser")
+    try:
+        httpd.serve_forever()
+    finally:
+        # Flush any queued log records before exiting
+        log_listener.stop()
 
 if __name__ == "__main__":
     # Get port from command line if provided